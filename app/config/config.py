@@ -1,3 +1,5 @@
+from typing import Literal
+
 from dotenv import load_dotenv
 from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -11,22 +13,67 @@ DEFAULT_EMBEDDING_CACHE_REDIS_URL = "redis://localhost:6379/1"
 
 class AppConfig(BaseSettings):
     database_url: str
+    database_pool_size: int = 10
+    database_max_overflow: int = 20
+    database_pool_timeout_seconds: int = 30
+    database_pool_recycle_seconds: int = 1800
+    database_pool_pre_ping: bool = True
+    database_statement_timeout_ms: int = 30000
     jwt_secret: str
     jwt_expires_minutes: int = 1440
     session_expires_minutes: int = 1440
     openai_api_key: str
     data_encryption_key: str
     redis_password: str | None = None
+    session_signing_secret: str | None = None
     rate_limit_redis_url: str = DEFAULT_RATE_LIMIT_REDIS_URL
     rate_limit_default: str = "120/minute"
     rate_limit_auth_token: str = "5/minute"
     rate_limit_auth_register: str = "3/minute"
     rate_limit_upload: str = "10/minute"
     rate_limit_ask: str = "60/minute"
+    rate_limit_ask_batch: str = "10/minute"
+    embedding_storage_type: Literal["vector", "halfvec"] = "vector"
+    embedding_dimensions: int = 1536
     embedding_cache_redis_url: str = DEFAULT_EMBEDDING_CACHE_REDIS_URL
     embedding_cache_doc_ttl_seconds: int = 43200
+    embedding_cache_query_ttl_seconds: int = 3600
+    embedding_cache_dtype: Literal["float32", "float16"] = "float32"
+    embedding_cache_write_in_background: bool = False
+    embedding_local_cache_max_bytes: int = 64 * 1024 * 1024
+    embedding_local_cache_ttl_seconds: int = 300
+    embedding_batch_max_inputs: int = 512
+    embedding_batch_max_tokens: int = 100000
+    embedding_max_concurrency: int = 4
+    chunk_insert_use_copy: bool = True
+    answer_cache_ttl_seconds: int = 3600
+    vector_search_exact_max_chunks: int = 2000
+    hnsw_ef_search_latency: int = 40
+    hnsw_ef_search_recall: int = 200
+    hnsw_max_scan_tuples: int = 20000
+    in_memory_search_max_chunks: int = 1000
+    in_memory_search_cache_max_bytes: int = 256 * 1024 * 1024
+    in_memory_search_cache_ttl_seconds: int = 600
+    hybrid_search_enabled: bool = True
+    hybrid_search_candidates: int = 20
+    hybrid_rrf_k: int = 60
+    lexical_search_max_chunks: int = 20000
+    lexical_search_cache_max_bytes: int = 128 * 1024 * 1024
+    lexical_search_cache_ttl_seconds: int = 600
+    ask_batch_max_concurrency: int = 5
+    qa_context_max_tokens: int = 6000
+    question_classifier_cache_max_items: int = 10000
+    question_classifier_cache_ttl_seconds: int = 86400
     upload_max_files: int = 5
     upload_max_file_size_bytes: int = 10 * 1024 * 1024
+    extraction_max_workers: int = 2
+    ingestion_workers: int = 2
+    ingestion_queue_max_size: int = 100
+    ingestion_queue_max_bytes: int = 256 * 1024 * 1024
+    ingestion_job_ttl_seconds: int = 3600
+    ingestion_shutdown_timeout_seconds: int = 30
+    run_migrations_on_startup: bool = False
+    warm_up_on_startup: bool = True
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,3 +1,3 @@
-from .session import engine, get_session
+from .session import async_engine, engine, get_async_session, get_session
 
-__all__ = ["engine", "get_session"]
+__all__ = ["async_engine", "engine", "get_async_session", "get_session"]
@@ -1,10 +1,41 @@
+from collections.abc import AsyncIterator
+
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.config import app_config
 
-engine = create_engine(app_config.database_url)
+
+def build_engine_options() -> dict:
+    options = {
+        "pool_size": app_config.database_pool_size,
+        "max_overflow": app_config.database_max_overflow,
+        "pool_timeout": app_config.database_pool_timeout_seconds,
+        "pool_recycle": app_config.database_pool_recycle_seconds,
+        "pool_pre_ping": app_config.database_pool_pre_ping,
+    }
+    if app_config.database_statement_timeout_ms > 0:
+        options["connect_args"] = {
+            "options": (
+                "-c statement_timeout="
+                f"{app_config.database_statement_timeout_ms}"
+            )
+        }
+    return options
+
+
+engine = create_engine(app_config.database_url, **build_engine_options())
+async_engine = create_async_engine(
+    app_config.database_url, **build_engine_options()
+)
 
 
 def get_session():
     with Session(engine) as session:
         yield session
+
+
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    async with AsyncSession(async_engine) as session:
+        yield session
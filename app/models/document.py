@@ -1,7 +1,7 @@
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import CheckConstraint, Column, DateTime, func
+from sqlalchemy import CheckConstraint, Column, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlmodel import Field, SQLModel
@@ -15,6 +15,8 @@ class Document(SQLModel, table=True):
             "(session_id IS NULL AND user_id IS NOT NULL)",
             name="documents_session_or_user_id_check",
         ),
+        Index("idx_documents_user_id_id", "user_id", "id"),
+        Index("idx_documents_session_id_id", "session_id", "id"),
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
@@ -1,15 +1,35 @@
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import Column, DateTime, ForeignKey, Text, func
+from pgvector.sqlalchemy import HALFVEC, Vector
+from sqlalchemy import Column, DateTime, ForeignKey, Index, LargeBinary, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlmodel import Field, SQLModel
 
+from app.config import app_config
+
+
+def get_embedding_column_type() -> Vector | HALFVEC:
+    if app_config.embedding_storage_type == "halfvec":
+        return HALFVEC(app_config.embedding_dimensions)
+    return Vector(app_config.embedding_dimensions)
+
 
 class EmbeddedDocument(SQLModel, table=True):
     __tablename__ = "EmbeddedDocuments"
+    __table_args__ = (
+        Index(
+            "idx_embedded_documents_session_id_document_id",
+            "session_id",
+            "documentId",
+        ),
+        Index(
+            "idx_embedded_documents_user_id_document_id",
+            "user_id",
+            "documentId",
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     created_at: datetime = Field(
@@ -18,7 +38,7 @@ class EmbeddedDocument(SQLModel, table=True):
             DateTime(timezone=True), server_default=func.now(), nullable=False
         ),
     )
-    content: str = Field(sa_column=Column(Text, nullable=False))
+    content: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
     metadata_: dict = Field(
         default_factory=dict,
         sa_column=Column(JSONB, name="metadata", nullable=False),
@@ -32,6 +52,14 @@ class EmbeddedDocument(SQLModel, table=True):
             index=True,
         ),
     )
+    session_id: UUID | None = Field(
+        default=None,
+        sa_column=Column(PG_UUID(as_uuid=True), nullable=True),
+    )
+    user_id: UUID | None = Field(
+        default=None,
+        sa_column=Column(PG_UUID(as_uuid=True), nullable=True),
+    )
     embedding: list[float] | None = Field(
-        default=None, sa_column=Column(Vector(1536))
+        default=None, sa_column=Column(get_embedding_column_type())
     )
@@ -1,25 +1,42 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import StreamingResponse
+from langchain_core.documents import Document as LCDocument
 from pydantic import BaseModel, Field, field_validator
+from starlette.concurrency import run_in_threadpool
 
 from app.config import app_config
 from app.services import (
     DocumentIdsEmptyError,
     DocumentIdsNotFoundError,
     EmbeddingGenerationError,
+    NO_ANSWER_TEXT,
     ScopeRequiredError,
-    answer_question,
-    classify_question,
+    SearchMode,
+    answer_question_async,
+    build_answer_key,
+    build_context,
+    build_answer_keys,
+    classify_question_async,
+    get_answer,
+    get_answers,
     get_current_user_id,
-    get_relevant_documents,
-    get_session,
-    is_session_expired,
+    get_relevant_documents_async,
+    get_relevant_documents_batch_async,
+    resolve_session_token,
+    set_answer,
+    stream_answer,
 )
 from app.utils import (
     AppError,
     AppErrorType,
     dedupe_document_ids,
+    format_sse_event,
     limiter,
     normalize_question,
 )
@@ -30,6 +47,14 @@ USER_ID_DEPENDENCY = Depends(get_current_user_id)
 ASK_QUESTION_MAX_LENGTH = 1000
 ASK_TOP_K_MAX = 20
 ASK_DOCUMENT_IDS_MAX = 20
+ASK_BATCH_QUESTIONS_MAX = 50
+SSE_MEDIA_TYPE = "text/event-stream"
+SESSION_TOKEN_MAX_LENGTH = 128
+
+
+AskQuestion = Annotated[
+    str, Field(min_length=1, max_length=ASK_QUESTION_MAX_LENGTH)
+]
 
 
 class AskRequest(BaseModel):
@@ -42,8 +67,13 @@ class AskRequest(BaseModel):
         ge=1,
         le=ASK_TOP_K_MAX,
     )
-    session_id: UUID | None = None
+    session_id: str | None = Field(
+        default=None,
+        max_length=SESSION_TOKEN_MAX_LENGTH,
+    )
     document_ids: list[UUID] | None = None
+    search_mode: SearchMode = "latency"
+    stream: bool = False
 
     @field_validator("question")
     @classmethod
@@ -58,9 +88,102 @@ class AskRequest(BaseModel):
         return dedupe_document_ids(value, max_items=ASK_DOCUMENT_IDS_MAX)
 
 
+class AskBatchRequest(BaseModel):
+    questions: list[AskQuestion] = Field(
+        min_length=1,
+        max_length=ASK_BATCH_QUESTIONS_MAX,
+    )
+    top_k: int = Field(
+        default=5,
+        ge=1,
+        le=ASK_TOP_K_MAX,
+    )
+    session_id: str | None = Field(
+        default=None,
+        max_length=SESSION_TOKEN_MAX_LENGTH,
+    )
+    document_ids: list[UUID] | None = None
+    search_mode: SearchMode = "latency"
+
+    @field_validator("questions")
+    @classmethod
+    def normalize_questions(cls, value: list[str]) -> list[str]:
+        return [normalize_question(question) for question in value]
+
+    @field_validator("document_ids")
+    @classmethod
+    def validate_document_ids(
+        cls, value: list[UUID] | None
+    ) -> list[UUID] | None:
+        return dedupe_document_ids(value, max_items=ASK_DOCUMENT_IDS_MAX)
+
+
+async def validate_ask_scope(
+    session_id: str | None, user_id: UUID | None
+) -> UUID | None:
+    if user_id and session_id:
+        raise AppError(AppErrorType.SESSION_ID_NOT_ALLOWED)
+
+    if not user_id and not session_id:
+        raise AppError(AppErrorType.SESSION_ID_REQUIRED)
+
+    if user_id:
+        return None
+    scope_session_id, _ = await resolve_session_token(session_id)
+    return scope_session_id
+
+
+@contextmanager
+def map_retrieval_errors() -> Iterator[None]:
+    try:
+        yield
+    except DocumentIdsEmptyError as error:
+        raise AppError(AppErrorType.DOCUMENT_IDS_EMPTY) from error
+    except ScopeRequiredError as error:
+        raise AppError(AppErrorType.SESSION_ID_REQUIRED) from error
+    except DocumentIdsNotFoundError as error:
+        raise AppError(AppErrorType.DOCUMENT_IDS_NOT_FOUND) from error
+    except EmbeddingGenerationError as error:
+        raise AppError(AppErrorType.EMBEDDING_FAILED) from error
+
+
+async def stream_cached_answer(answer: str) -> AsyncIterator[str]:
+    yield format_sse_event("done", {"answer": answer})
+
+
+async def stream_answer_events(
+    question: str,
+    docs: list[LCDocument],
+    answer_key: str | None,
+) -> AsyncIterator[str]:
+    yield format_sse_event(
+        "retrieval",
+        {"chunks": [doc.metadata for doc in docs]},
+    )
+
+    context = build_context(docs)
+    tokens: list[str] = []
+    try:
+        async for token in stream_answer(question, context):
+            tokens.append(token)
+            yield format_sse_event("token", {"text": token})
+        answer = "".join(tokens).strip() or NO_ANSWER_TEXT
+    except Exception:
+        answer = NO_ANSWER_TEXT
+
+    if answer_key and answer != NO_ANSWER_TEXT:
+        await run_in_threadpool(set_answer, answer_key, answer)
+    yield format_sse_event("done", {"answer": answer})
+
+
+def discard_task(task: asyncio.Task) -> None:
+    task.cancel()
+    task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+
 @router.post("/ask", status_code=status.HTTP_200_OK)
 @limiter.limit(app_config.rate_limit_ask)
-def ask_question(
+async def ask_question(
     request: Request,
     payload: AskRequest,
     user_id: UUID | None = USER_ID_DEPENDENCY,
@@ -73,43 +196,155 @@ def ask_question(
         payload.document_ids,
     )
 
-    if user_id and session_id:
-        raise AppError(AppErrorType.SESSION_ID_NOT_ALLOWED)
+    session_id = await validate_ask_scope(session_id, user_id)
 
-    if not user_id and not session_id:
-        raise AppError(AppErrorType.SESSION_ID_REQUIRED)
-
-    if not user_id and session_id:
-        session_record = get_session(session_id)
-        if not session_record:
-            raise AppError(AppErrorType.SESSION_NOT_FOUND)
-        if is_session_expired(session_record):
-            raise AppError(AppErrorType.SESSION_EXPIRED)
-
-    classification = classify_question(question)
-    if not classification.is_valid:
-        raise AppError(AppErrorType.QUESTION_INVALID)
+    answer_key = await run_in_threadpool(
+        build_answer_key,
+        question,
+        top_k,
+        session_id,
+        user_id,
+        document_ids,
+        payload.search_mode,
+    )
+    if answer_key:
+        cached_answer = await run_in_threadpool(get_answer, answer_key)
+        if cached_answer is not None:
+            if payload.stream:
+                return StreamingResponse(
+                    stream_cached_answer(cached_answer),
+                    media_type=SSE_MEDIA_TYPE,
+                )
+            return {"answer": cached_answer}
 
-    try:
-        docs = get_relevant_documents(
+    retrieval = asyncio.create_task(
+        get_relevant_documents_async(
             query=question,
             k=top_k,
             session_id=session_id,
             user_id=user_id,
             document_ids=document_ids,
+            search_mode=payload.search_mode,
         )
-    except DocumentIdsEmptyError as error:
-        raise AppError(AppErrorType.DOCUMENT_IDS_EMPTY) from error
-    except ScopeRequiredError as error:
-        raise AppError(AppErrorType.SESSION_ID_REQUIRED) from error
-    except DocumentIdsNotFoundError as error:
-        raise AppError(AppErrorType.DOCUMENT_IDS_NOT_FOUND) from error
-    except EmbeddingGenerationError as error:
-        raise AppError(AppErrorType.EMBEDDING_FAILED) from error
+    )
+    try:
+        classification = await classify_question_async(question)
+    except BaseException:
+        discard_task(retrieval)
+        raise
+    if not classification.is_valid:
+        discard_task(retrieval)
+        raise AppError(AppErrorType.QUESTION_INVALID)
+
+    with map_retrieval_errors():
+        docs = await retrieval
 
     if not docs:
         raise AppError(AppErrorType.NO_RELEVANT_CONTEXT)
 
-    context = "\n\n".join(doc.page_content for doc in docs)
-    answer = answer_question(question, context)
+    if payload.stream:
+        return StreamingResponse(
+            stream_answer_events(question, docs, answer_key),
+            media_type=SSE_MEDIA_TYPE,
+        )
+
+    context = build_context(docs)
+    answer = await answer_question_async(question, context)
+    if answer_key and answer != NO_ANSWER_TEXT:
+        await run_in_threadpool(set_answer, answer_key, answer)
     return {"answer": answer}
+
+
+@router.post("/ask/batch", status_code=status.HTTP_200_OK)
+@limiter.limit(app_config.rate_limit_ask_batch)
+async def ask_questions_batch(
+    request: Request,
+    payload: AskBatchRequest,
+    user_id: UUID | None = USER_ID_DEPENDENCY,
+):
+    questions, top_k, session_id, document_ids = (
+        payload.questions,
+        payload.top_k,
+        payload.session_id,
+        payload.document_ids,
+    )
+
+    session_id = await validate_ask_scope(session_id, user_id)
+
+    results: list[dict] = [{"question": question} for question in questions]
+    answer_keys = await run_in_threadpool(
+        build_answer_keys,
+        questions,
+        top_k,
+        session_id,
+        user_id,
+        document_ids,
+        payload.search_mode,
+    )
+    cached_answers = await run_in_threadpool(get_answers, answer_keys)
+    pending_indexes: list[int] = []
+    for index, cached_answer in enumerate(cached_answers):
+        if cached_answer is None:
+            pending_indexes.append(index)
+        else:
+            results[index]["answer"] = cached_answer
+
+    semaphore = asyncio.Semaphore(app_config.ask_batch_max_concurrency)
+
+    async def classify(index: int) -> bool:
+        async with semaphore:
+            classification = await classify_question_async(questions[index])
+        return classification.is_valid
+
+    async def answer(index: int, docs: list[LCDocument]) -> None:
+        if not docs:
+            results[index]["error"] = AppError(
+                AppErrorType.NO_RELEVANT_CONTEXT
+            ).body
+            return
+        context = build_context(docs)
+        async with semaphore:
+            answer_text = await answer_question_async(questions[index], context)
+        results[index]["answer"] = answer_text
+        if answer_keys[index] and answer_text != NO_ANSWER_TEXT:
+            await run_in_threadpool(set_answer, answer_keys[index], answer_text)
+
+    if not pending_indexes:
+        return {"answers": results}
+
+    retrieval = asyncio.create_task(
+        get_relevant_documents_batch_async(
+            queries=[questions[index] for index in pending_indexes],
+            k=top_k,
+            session_id=session_id,
+            user_id=user_id,
+            document_ids=document_ids,
+            search_mode=payload.search_mode,
+        )
+    )
+    try:
+        validity = await asyncio.gather(
+            *(classify(index) for index in pending_indexes)
+        )
+    except BaseException:
+        discard_task(retrieval)
+        raise
+    docs_per_question: list[list[LCDocument]] = []
+    if not any(validity):
+        discard_task(retrieval)
+    else:
+        with map_retrieval_errors():
+            docs_per_question = await retrieval
+
+    answers = []
+    for position, (index, is_valid) in enumerate(
+        zip(pending_indexes, validity, strict=True)
+    ):
+        if not is_valid:
+            results[index]["error"] = AppError(
+                AppErrorType.QUESTION_INVALID
+            ).body
+            continue
+        answers.append(answer(index, docs_per_question[position]))
+    await asyncio.gather(*answers)
+    return {"answers": results}
@@ -1,5 +1,7 @@
 from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
 
+from app.services import get_readiness
 from app.utils import ResponseMessages
 
 router = APIRouter()
@@ -8,3 +10,13 @@ router = APIRouter()
 @router.get("/health", status_code=status.HTTP_200_OK)
 def health_check():
     return {"status": ResponseMessages.HEALTH_OK}
+
+
+@router.get("/ready", status_code=status.HTTP_200_OK)
+async def readiness_check():
+    readiness = await get_readiness()
+    if not readiness["ready"]:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=readiness
+        )
+    return readiness
@@ -0,0 +1,50 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, status
+
+from app.services import (
+    IngestionJob,
+    get_current_user_id,
+    get_ingestion_job,
+)
+from app.utils import AppError, AppErrorType, parse_session_token
+
+router = APIRouter()
+
+USER_ID_DEPENDENCY = Depends(get_current_user_id)
+
+
+def serialize_job(job: IngestionJob) -> dict:
+    return {
+        "job_id": str(job.id),
+        "status": job.status.value,
+        "files": [
+            {
+                "filename": job_file.filename,
+                "status": job_file.status.value,
+                "document_id": (
+                    str(job_file.document_id) if job_file.document_id else None
+                ),
+            }
+            for job_file in job.files
+        ],
+        "document_ids": [str(document_id) for document_id in job.document_ids],
+        "error": job.error,
+    }
+
+
+@router.get("/jobs/{job_id}", status_code=status.HTTP_200_OK)
+def get_job(
+    job_id: UUID,
+    session_id: str | None = None,
+    user_id: UUID | None = USER_ID_DEPENDENCY,
+):
+    job = get_ingestion_job(job_id)
+    if not job or job.user_id != user_id:
+        raise AppError(AppErrorType.JOB_NOT_FOUND)
+    if not user_id and (
+        not session_id
+        or job.session_id != parse_session_token(session_id).session_id
+    ):
+        raise AppError(AppErrorType.JOB_NOT_FOUND)
+    return serialize_job(job)
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, status
+
+from app.services import (
+    get_classifier_stats,
+    get_lexical_index_stats,
+    get_local_cache_stats,
+    get_scope_index_stats,
+)
+
+router = APIRouter()
+
+
+@router.get("/stats", status_code=status.HTTP_200_OK)
+def get_stats():
+    return {
+        "embedding_local_cache": get_local_cache_stats(),
+        "lexical_index": get_lexical_index_stats(),
+        "question_classifier": get_classifier_stats(),
+        "scope_index": get_scope_index_stats(),
+    }
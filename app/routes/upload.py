@@ -1,21 +1,29 @@
+import asyncio
+from functools import partial
 from pathlib import Path
 from typing import Any, Mapping
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, Request, UploadFile, status
+from fastapi.responses import JSONResponse
 from pydantic.annotated_handlers import GetJsonSchemaHandler
+from starlette.concurrency import run_in_threadpool
 
 from app.config import app_config
 from app.services import (
     EmbeddingGenerationError,
+    ExtractionUnavailableError,
+    IngestionJob,
     TextExtractionError,
     UnsupportedContentTypeError,
-    create_session,
-    extract_text,
+    build_session_token,
+    create_session_async,
+    extract_text_async,
     get_current_user_id,
-    get_session,
     insert_documents_with_chunks,
-    is_session_expired,
+    resolve_session_token,
+    submit_ingestion_job,
+    track_file_extraction,
 )
 from app.utils import (
     AppError,
@@ -41,12 +49,127 @@ class SchemaUploadFile(UploadFile):
         return {"type": "string", "format": "binary"}
 
 
+def get_upload_filename(file: UploadFile) -> str:
+    filename = Path(file.filename or "unknown").name.strip() or "unknown"
+    return filename[:MAX_FILENAME_LENGTH]
+
+
+async def read_upload_file(file: UploadFile) -> bytes:
+    if not file.content_type:
+        raise AppError(AppErrorType.CONTENT_TYPE_REQUIRED)
+    if not is_allowed_content_type(file.content_type):
+        raise AppError(
+            AppErrorType.UNSUPPORTED_CONTENT_TYPE,
+            message=ErrorMessages.UNSUPPORTED_CONTENT_TYPE.format(
+                content_type=file.content_type
+            ),
+        )
+
+    file_bytes = await file.read()
+    if not file_bytes:
+        raise AppError(
+            AppErrorType.EMPTY_FILE,
+            message=ErrorMessages.EMPTY_FILE.format(filename=file.filename),
+        )
+    if len(file_bytes) > app_config.upload_max_file_size_bytes:
+        raise AppError(
+            AppErrorType.FILE_TOO_LARGE,
+            message=ErrorMessages.FILE_TOO_LARGE.format(filename=file.filename),
+        )
+    return file_bytes
+
+
+async def extract_upload_file(
+    file: UploadFile, file_bytes: bytes
+) -> dict[str, Any]:
+    try:
+        text, pdf_metadata = await extract_text_async(
+            file_bytes, file.content_type
+        )
+    except UnsupportedContentTypeError as error:
+        raise AppError(
+            AppErrorType.UNSUPPORTED_CONTENT_TYPE,
+            message=str(error),
+        ) from error
+    except ExtractionUnavailableError as error:
+        raise AppError(AppErrorType.EXTRACTION_UNAVAILABLE) from error
+    except TextExtractionError as error:
+        raise AppError(
+            AppErrorType.NO_TEXT_EXTRACTED,
+            message=ErrorMessages.FAILED_TO_EXTRACT_TEXT.format(
+                filename=file.filename
+            ),
+        ) from error
+
+    if not text.strip():
+        raise AppError(
+            AppErrorType.NO_TEXT_EXTRACTED,
+            message=ErrorMessages.NO_TEXT_EXTRACTED.format(
+                filename=file.filename
+            ),
+        )
+    metadata: dict[str, Any] = {"content_type": file.content_type}
+    if pdf_metadata:
+        page_count = pdf_metadata.get("page_count")
+        if page_count is not None:
+            metadata["page_count"] = page_count
+
+    return {
+        "content_type": file.content_type,
+        "text": text,
+        "metadata": metadata,
+    }
+
+
+async def insert_extracted_documents(
+    extracted_documents: list[dict[str, Any]],
+    session_id: UUID | None,
+    user_id: UUID | None,
+) -> list[UUID]:
+    document_metadata = [
+        extracted_doc["metadata"] for extracted_doc in extracted_documents
+    ]
+    document_texts = [
+        extracted_doc["text"] for extracted_doc in extracted_documents
+    ]
+    try:
+        return await run_in_threadpool(
+            insert_documents_with_chunks,
+            session_id=session_id,
+            user_id=user_id,
+            metadata_list=document_metadata,
+            texts=document_texts,
+        )
+    except EmbeddingGenerationError as error:
+        raise AppError(AppErrorType.EMBEDDING_FAILED) from error
+
+
+async def run_ingestion_job(
+    job: IngestionJob,
+    uploads: list[tuple[UploadFile, bytes]],
+    session_id: UUID | None,
+    user_id: UUID | None,
+) -> list[UUID]:
+    extracted_documents = await asyncio.gather(
+        *(
+            track_file_extraction(
+                job, index, extract_upload_file(file, file_bytes)
+            )
+            for index, (file, file_bytes) in enumerate(uploads)
+        )
+    )
+    return await insert_extracted_documents(
+        extracted_documents, session_id=session_id, user_id=user_id
+    )
+
+
 @router.post("/upload", status_code=status.HTTP_201_CREATED)
 @limiter.limit(app_config.rate_limit_upload)
 async def upload_files(
     request: Request,
     files: list[SchemaUploadFile] = FILES_PARAM,
-    session_id: UUID | None = None,
+    session_id: str | None = None,
+    background: bool = False,
     user_id: UUID | None = USER_ID_DEPENDENCY,
 ):
     if not files:
@@ -58,98 +181,49 @@ async def upload_files(
                 max_files=app_config.upload_max_files
             ),
         )
+    session_token = None
     if user_id:
-        session_id = None
+        scope_session_id = None
     elif session_id is None:
-        session_id = create_session().id
+        session_record = await create_session_async()
+        scope_session_id = session_record.id
+        session_token = build_session_token(session_record)
     else:
-        session_record = get_session(session_id)
-        if not session_record:
-            raise AppError(AppErrorType.SESSION_NOT_FOUND)
-        if is_session_expired(session_record):
-            raise AppError(AppErrorType.SESSION_EXPIRED)
-
-    extracted_documents: list[dict[str, Any]] = []
-
-    for file in files:
-        if not file.content_type:
-            raise AppError(AppErrorType.CONTENT_TYPE_REQUIRED)
-        if not is_allowed_content_type(file.content_type):
-            raise AppError(
-                AppErrorType.UNSUPPORTED_CONTENT_TYPE,
-                message=ErrorMessages.UNSUPPORTED_CONTENT_TYPE.format(
-                    content_type=file.content_type
-                ),
-            )
-
-        file_bytes = await file.read()
-        if not file_bytes:
-            raise AppError(
-                AppErrorType.EMPTY_FILE,
-                message=ErrorMessages.EMPTY_FILE.format(filename=file.filename),
-            )
-        if len(file_bytes) > app_config.upload_max_file_size_bytes:
-            raise AppError(
-                AppErrorType.FILE_TOO_LARGE,
-                message=ErrorMessages.FILE_TOO_LARGE.format(
-                    filename=file.filename
-                ),
-            )
-
-        try:
-            text, pdf_metadata = extract_text(file_bytes, file.content_type)
-        except UnsupportedContentTypeError as error:
-            raise AppError(
-                AppErrorType.UNSUPPORTED_CONTENT_TYPE,
-                message=str(error),
-            ) from error
-        except TextExtractionError as error:
-            raise AppError(
-                AppErrorType.NO_TEXT_EXTRACTED,
-                message=ErrorMessages.FAILED_TO_EXTRACT_TEXT.format(
-                    filename=file.filename
-                ),
-            ) from error
-
-        if not text.strip():
-            raise AppError(
-                AppErrorType.NO_TEXT_EXTRACTED,
-                message=ErrorMessages.NO_TEXT_EXTRACTED.format(
-                    filename=file.filename
-                ),
-            )
-        metadata: dict[str, Any] = {"content_type": file.content_type}
-        if pdf_metadata:
-            page_count = pdf_metadata.get("page_count")
-            if page_count is not None:
-                metadata["page_count"] = page_count
-
-        filename = Path(file.filename or "unknown").name.strip() or "unknown"
-        if len(filename) > MAX_FILENAME_LENGTH:
-            filename = filename[:MAX_FILENAME_LENGTH]
-        extracted_documents.append(
-            {
-                "content_type": file.content_type,
-                "text": text,
-                "metadata": metadata,
-            }
+        scope_session_id, session_token = await resolve_session_token(
+            session_id
         )
 
-    document_metadata = [
-        extracted_doc["metadata"] for extracted_doc in extracted_documents
-    ]
-    document_texts = [
-        extracted_doc["text"] for extracted_doc in extracted_documents
-    ]
-    try:
-        inserted_document_ids = insert_documents_with_chunks(
-            session_id=session_id,
+    uploads = [(file, await read_upload_file(file)) for file in files]
+
+    if background:
+        job = submit_ingestion_job(
+            filenames=[get_upload_filename(file) for file, _ in uploads],
+            session_id=scope_session_id,
             user_id=user_id,
-            metadata_list=document_metadata,
-            texts=document_texts,
+            pipeline=partial(
+                run_ingestion_job,
+                uploads=uploads,
+                session_id=scope_session_id,
+                user_id=user_id,
+            ),
+            size_bytes=sum(len(file_bytes) for _, file_bytes in uploads),
         )
-    except EmbeddingGenerationError as error:
-        raise AppError(AppErrorType.EMBEDDING_FAILED) from error
+        response = {
+            "message": ResponseMessages.FILES_ACCEPTED,
+            "job_id": str(job.id),
+        }
+        if not user_id:
+            response["session_id"] = session_token
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED, content=response
+        )
+
+    extracted_documents = await asyncio.gather(
+        *(extract_upload_file(file, file_bytes) for file, file_bytes in uploads)
+    )
+    inserted_document_ids = await insert_extracted_documents(
+        extracted_documents, session_id=scope_session_id, user_id=user_id
+    )
 
     response = {
         "message": ResponseMessages.FILES_UPLOADED,
@@ -158,6 +232,6 @@ async def upload_files(
         ],
     }
     if not user_id:
-        response["session_id"] = str(session_id)
+        response["session_id"] = session_token
 
     return response
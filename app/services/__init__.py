@@ -1,39 +1,114 @@
+from .answer_cache import (
+    build_answer_key,
+    build_answer_keys,
+    get_answer,
+    get_answers,
+    set_answer,
+)
 from .document_store import (
+    SearchMode,
     insert_documents,
     insert_document_chunks,
     insert_documents_with_chunks,
-    get_relevant_documents,
+    get_relevant_documents_async,
+    get_relevant_documents_batch_async,
 )
+from .embedding_cache import get_local_cache_stats
+from .lexical_index import get_lexical_index_stats
+from .scope_index import get_scope_index_stats
 from .errors import (
     DocumentIdsEmptyError,
     DocumentIdsNotFoundError,
     EmbeddingGenerationError,
+    ExtractionUnavailableError,
     ScopeRequiredError,
     TextExtractionError,
     UnsupportedContentTypeError,
 )
-from .extract import extract_text
-from .qa import answer_question
-from .question_classifier import classify_question
+from .ingestion_jobs import (
+    IngestionJob,
+    get_ingestion_job,
+    start_ingestion_workers,
+    stop_ingestion_workers,
+    submit_ingestion_job,
+    track_file_extraction,
+)
+from .extract import (
+    extract_text,
+    extract_text_async,
+    shutdown_extraction_executor,
+    warm_extraction_workers,
+)
+from .context_builder import build_context
+from .qa import (
+    NO_ANSWER_TEXT,
+    answer_question_async,
+    stream_answer,
+)
+from .question_classifier import (
+    classify_question_async,
+    get_classifier_stats,
+)
 from .auth import get_current_user_id
-from .sessions import create_session, get_session, is_session_expired
+from .warmup import get_readiness, stop_warm_up, time_startup_phase, warm_up
+from .sessions import (
+    build_session_token,
+    create_session,
+    create_session_async,
+    get_session,
+    get_session_async,
+    is_session_expired,
+    resolve_session_token,
+)
 
 __all__ = [
+    "SearchMode",
+    "build_answer_key",
+    "build_answer_keys",
+    "get_answer",
+    "get_answers",
+    "set_answer",
     "insert_documents",
     "insert_document_chunks",
     "insert_documents_with_chunks",
-    "get_relevant_documents",
+    "get_relevant_documents_async",
+    "get_relevant_documents_batch_async",
+    "get_local_cache_stats",
+    "get_lexical_index_stats",
+    "get_scope_index_stats",
     "DocumentIdsEmptyError",
     "DocumentIdsNotFoundError",
     "EmbeddingGenerationError",
+    "ExtractionUnavailableError",
     "ScopeRequiredError",
     "TextExtractionError",
     "UnsupportedContentTypeError",
     "extract_text",
-    "answer_question",
-    "classify_question",
+    "extract_text_async",
+    "shutdown_extraction_executor",
+    "warm_extraction_workers",
+    "IngestionJob",
+    "get_ingestion_job",
+    "start_ingestion_workers",
+    "stop_ingestion_workers",
+    "submit_ingestion_job",
+    "track_file_extraction",
+    "NO_ANSWER_TEXT",
+    "build_context",
+    "answer_question_async",
+    "stream_answer",
+    "classify_question_async",
+    "get_classifier_stats",
     "get_current_user_id",
+    "get_readiness",
+    "stop_warm_up",
+    "time_startup_phase",
+    "warm_up",
+    "build_session_token",
     "create_session",
+    "create_session_async",
     "get_session",
+    "get_session_async",
     "is_session_expired",
+    "resolve_session_token",
 ]
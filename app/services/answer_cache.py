@@ -0,0 +1,156 @@
+import hashlib
+import json
+import time
+from uuid import UUID
+
+import structlog
+
+from app.config import app_config
+from app.services.embedding_cache import get_client
+from app.utils import AppError, decrypt, encrypt
+
+logger = structlog.get_logger(__name__)
+
+
+def build_scope_key(session_id: UUID | None, user_id: UUID | None) -> str:
+    if user_id:
+        return f"user:{user_id}"
+    return f"session:{session_id}"
+
+
+def build_scope_version_key(
+    session_id: UUID | None, user_id: UUID | None
+) -> str:
+    return f"scope_version:{build_scope_key(session_id, user_id)}"
+
+
+def get_scope_version_ttl_seconds() -> int:
+    return max(
+        app_config.answer_cache_ttl_seconds,
+        app_config.session_expires_minutes * 60,
+    )
+
+
+def get_scope_version(
+    session_id: UUID | None, user_id: UUID | None
+) -> int | None:
+    try:
+        redis_client = get_client()
+        if redis_client is None:
+            return None
+        value = redis_client.get(build_scope_version_key(session_id, user_id))
+    except Exception:
+        return None
+    return int(value) if value else 0
+
+
+def bump_scope_version(session_id: UUID | None, user_id: UUID | None) -> None:
+    try:
+        redis_client = get_client()
+        if redis_client is None:
+            return
+        key = build_scope_version_key(session_id, user_id)
+        ttl_seconds = get_scope_version_ttl_seconds()
+        pipeline = redis_client.pipeline()
+        pipeline.set(key, time.time_ns() // 1_000_000, nx=True, ex=ttl_seconds)
+        pipeline.incr(key)
+        pipeline.expire(key, ttl_seconds)
+        pipeline.execute()
+    except Exception:
+        logger.warning(
+            "scope_version_bump_failed",
+            scope=build_scope_key(session_id, user_id),
+        )
+
+
+def build_answer_keys(
+    questions: list[str],
+    top_k: int,
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID] | None,
+    search_mode: str,
+) -> list[str | None]:
+    if app_config.answer_cache_ttl_seconds <= 0:
+        return [None] * len(questions)
+    scope_version = get_scope_version(session_id, user_id)
+    if scope_version is None:
+        return [None] * len(questions)
+
+    scope_key = build_scope_key(session_id, user_id)
+    sorted_document_ids = sorted(
+        str(document_id) for document_id in document_ids or []
+    )
+    keys: list[str | None] = []
+    for question in questions:
+        payload = json.dumps(
+            [
+                " ".join(question.lower().split()),
+                top_k,
+                sorted_document_ids,
+                search_mode,
+            ],
+            separators=(",", ":"),
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        keys.append(f"answers:{scope_key}:{scope_version}:{digest}")
+    return keys
+
+
+def build_answer_key(
+    question: str,
+    top_k: int,
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID] | None,
+    search_mode: str,
+) -> str | None:
+    return build_answer_keys(
+        [question], top_k, session_id, user_id, document_ids, search_mode
+    )[0]
+
+
+def decrypt_answer(value: bytes | None) -> str | None:
+    if not value:
+        return None
+    try:
+        return decrypt(value)
+    except AppError:
+        return None
+
+
+def get_answers(keys: list[str | None]) -> list[str | None]:
+    lookup_keys = [key for key in keys if key]
+    if not lookup_keys:
+        return [None] * len(keys)
+    try:
+        redis_client = get_client()
+        if redis_client is None:
+            return [None] * len(keys)
+        raw_values = dict(zip(lookup_keys, redis_client.mget(lookup_keys)))
+    except Exception:
+        return [None] * len(keys)
+    return [decrypt_answer(raw_values[key]) if key else None for key in keys]
+
+
+def get_answer(key: str) -> str | None:
+    try:
+        redis_client = get_client()
+        if redis_client is None:
+            return None
+        value = redis_client.get(key)
+    except Exception:
+        return None
+    return decrypt_answer(value)
+
+
+def set_answer(key: str, answer: str) -> None:
+    try:
+        redis_client = get_client()
+        if redis_client is None:
+            return
+        redis_client.setex(
+            key, app_config.answer_cache_ttl_seconds, encrypt(answer)
+        )
+    except Exception:
+        return
@@ -0,0 +1,75 @@
+import psycopg
+from pgvector.psycopg import register_vector
+from sqlmodel import Session
+
+from app.config import app_config
+from app.models import Document, EmbeddedDocument
+
+DOCUMENTS_COPY_SQL = (
+    'COPY "Documents" (id, created_at, metadata, session_id, user_id) '
+    "FROM STDIN (FORMAT BINARY)"
+)
+DOCUMENTS_COPY_TYPES = ["uuid", "timestamptz", "jsonb", "uuid", "uuid"]
+
+EMBEDDED_DOCUMENTS_COPY_SQL = (
+    'COPY "EmbeddedDocuments" '
+    '(id, created_at, content, metadata, "documentId", session_id, user_id, '
+    "embedding) FROM STDIN (FORMAT BINARY)"
+)
+
+
+def get_copy_connection(session: Session) -> psycopg.Connection:
+    connection = session.connection().connection.driver_connection
+    if connection.adapters.types.get(app_config.embedding_storage_type) is None:
+        register_vector(connection)
+    return connection
+
+
+def copy_documents(session: Session, documents: list[Document]) -> None:
+    connection = get_copy_connection(session)
+    with connection.cursor() as cursor:
+        with cursor.copy(DOCUMENTS_COPY_SQL) as copy:
+            copy.set_types(DOCUMENTS_COPY_TYPES)
+            for document in documents:
+                copy.write_row(
+                    (
+                        document.id,
+                        document.created_at,
+                        document.metadata_,
+                        document.session_id,
+                        document.user_id,
+                    )
+                )
+
+
+def copy_embedded_documents(
+    session: Session, records: list[EmbeddedDocument]
+) -> None:
+    connection = get_copy_connection(session)
+    with connection.cursor() as cursor:
+        with cursor.copy(EMBEDDED_DOCUMENTS_COPY_SQL) as copy:
+            copy.set_types(
+                [
+                    "uuid",
+                    "timestamptz",
+                    "bytea",
+                    "jsonb",
+                    "uuid",
+                    "uuid",
+                    "uuid",
+                    app_config.embedding_storage_type,
+                ]
+            )
+            for record in records:
+                copy.write_row(
+                    (
+                        record.id,
+                        record.created_at,
+                        record.content,
+                        record.metadata_,
+                        record.document_id,
+                        record.session_id,
+                        record.user_id,
+                        record.embedding,
+                    )
+                )
@@ -0,0 +1,153 @@
+from functools import cache
+
+import tiktoken
+from langchain_core.documents import Document as LCDocument
+
+from app.config import app_config
+
+CONTEXT_ENCODING = "o200k_base"
+OVERLAP_SEARCH_MAX_CHARS = 400
+DOCUMENT_SEPARATOR = "\n\n"
+CHUNK_SEPARATOR = "\n"
+SEPARATOR_TOKENS = 2
+
+
+@cache
+def get_context_encoding() -> tiktoken.Encoding:
+    return tiktoken.get_encoding(CONTEXT_ENCODING)
+
+
+def count_chunk_tokens(
+    texts: list[str], start_indexes: list[int]
+) -> list[tuple[int, int]]:
+    encoding = get_context_encoding()
+    overlaps = [0] + [
+        max(
+            0,
+            start_indexes[index - 1]
+            + len(texts[index - 1])
+            - start_indexes[index],
+        )
+        for index in range(1, len(texts))
+    ]
+    token_counts = encoding.encode_ordinary_batch(texts)
+    overlap_counts = encoding.encode_ordinary_batch(
+        [text[:overlap] for text, overlap in zip(texts, overlaps)]
+    )
+    return [
+        (len(tokens), len(overlap_tokens))
+        for tokens, overlap_tokens in zip(token_counts, overlap_counts)
+    ]
+
+
+def find_overlap(previous: LCDocument, current: LCDocument) -> int:
+    previous_start = previous.metadata.get("start_index")
+    current_start = current.metadata.get("start_index")
+    if previous_start is not None and current_start is not None:
+        return max(
+            0,
+            min(
+                previous_start + len(previous.page_content) - current_start,
+                len(current.page_content),
+            ),
+        )
+
+    max_overlap = min(
+        len(previous.page_content),
+        len(current.page_content),
+        OVERLAP_SEARCH_MAX_CHARS,
+    )
+    for size in range(max_overlap, 0, -1):
+        if previous.page_content.endswith(current.page_content[:size]):
+            return size
+    return 0
+
+
+def get_token_count(document: LCDocument) -> int:
+    token_count = document.metadata.get("token_count")
+    if token_count is None:
+        token_count = len(
+            get_context_encoding().encode_ordinary(document.page_content)
+        )
+    return token_count
+
+
+def get_chunk_key(document: LCDocument) -> tuple:
+    return (
+        document.metadata.get("document_id"),
+        document.metadata.get("chunk_index"),
+    )
+
+
+def get_neighbour_key(document: LCDocument, offset: int) -> tuple | None:
+    chunk_index = document.metadata.get("chunk_index")
+    if chunk_index is None:
+        return None
+    return (document.metadata.get("document_id"), chunk_index + offset)
+
+
+def truncate_chunk(document: LCDocument, max_tokens: int) -> LCDocument:
+    encoding = get_context_encoding()
+    tokens = encoding.encode_ordinary(document.page_content)[:max_tokens]
+    return LCDocument(
+        page_content=encoding.decode(tokens),
+        metadata={
+            **document.metadata,
+            "token_count": len(tokens),
+            "overlap_token_count": 0,
+        },
+    )
+
+
+def select_chunks(docs: list[LCDocument], max_tokens: int) -> dict:
+    selected: dict[tuple, LCDocument] = {}
+    used_tokens = 0
+    for document in docs:
+        key = get_chunk_key(document)
+        if key in selected:
+            continue
+        cost = get_token_count(document) + SEPARATOR_TOKENS
+        if get_neighbour_key(document, -1) in selected:
+            cost -= document.metadata.get("overlap_token_count", 0)
+        next_document = selected.get(get_neighbour_key(document, 1))
+        if next_document is not None:
+            cost -= next_document.metadata.get("overlap_token_count", 0)
+        if used_tokens + cost > max_tokens:
+            continue
+        selected[key] = document
+        used_tokens += cost
+    if not selected and docs:
+        top_document = truncate_chunk(
+            docs[0], max(max_tokens - SEPARATOR_TOKENS, 0)
+        )
+        selected[get_chunk_key(top_document)] = top_document
+    return selected
+
+
+def build_context(docs: list[LCDocument], max_tokens: int | None = None) -> str:
+    if max_tokens is None:
+        max_tokens = app_config.qa_context_max_tokens
+    selected = select_chunks(docs, max_tokens)
+
+    chunks_by_document: dict = {}
+    for document in selected.values():
+        chunks_by_document.setdefault(
+            document.metadata.get("document_id"), []
+        ).append(document)
+
+    sections: list[str] = []
+    for chunks in chunks_by_document.values():
+        chunks.sort(key=lambda chunk: chunk.metadata.get("chunk_index", 0))
+        parts = [chunks[0].page_content]
+        for previous, current in zip(chunks, chunks[1:]):
+            if current.metadata.get("chunk_index") == (
+                previous.metadata.get("chunk_index", -2) + 1
+            ):
+                overlap = find_overlap(previous, current)
+                parts.append(CHUNK_SEPARATOR)
+                parts.append(current.page_content[overlap:].lstrip())
+            else:
+                parts.append(DOCUMENT_SEPARATOR)
+                parts.append(current.page_content)
+        sections.append("".join(parts))
+    return DOCUMENT_SEPARATOR.join(sections)
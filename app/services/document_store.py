@@ -1,19 +1,54 @@
+import asyncio
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import Literal
 from uuid import UUID
 
+import structlog
+import tiktoken
 from langchain_core.documents import Document as LCDocument
 from langchain_openai import OpenAIEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
+from sqlalchemy import CompoundSelect, Select, func, literal, union_all
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.config import app_config
-from app.database import engine
+from app.database import async_engine, engine
 from app.models import Document, EmbeddedDocument
+from app.services.answer_cache import (
+    build_scope_key,
+    bump_scope_version,
+    get_scope_version,
+)
+from app.services.bulk_copy import copy_documents, copy_embedded_documents
+from app.services.context_builder import count_chunk_tokens
 from app.services.embedding_cache import (
+    DEFAULT_EMBEDDING_DIMENSIONS,
     build_doc_chunk_key,
+    build_query_key,
     get_embeddings,
-    set_embedding,
+    set_embeddings,
+)
+from app.services.lexical_index import (
+    OVERSIZED_LEXICAL_SCOPE,
+    LexicalIndex,
+    build_lexical_index,
+    get_cached_lexical_index,
+    search_lexical_index,
+    set_cached_lexical_index,
 )
-from app.utils import decrypt, encrypt
+from app.services.scope_index import (
+    OVERSIZED_SCOPE,
+    ScopeIndex,
+    build_scope_index,
+    get_cached_scope_index,
+    search_scope_index,
+    set_cached_scope_index,
+)
+from app.utils import decrypt_many, encrypt_many
 from app.services.errors import (
     EmbeddingGenerationError,
     DocumentIdsEmptyError,
@@ -21,7 +56,119 @@ from app.services.errors import (
     ScopeRequiredError,
 )
 
-openAIEmbeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+logger = structlog.get_logger(__name__)
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+SearchMode = Literal["latency", "recall"]
+
+SEARCH_RESULT_COLUMNS = [
+    EmbeddedDocument.id.label("id"),
+    EmbeddedDocument.content.label("content"),
+    EmbeddedDocument.metadata_.label("metadata"),
+    EmbeddedDocument.document_id.label("document_id"),
+]
+
+embedding_executor: ThreadPoolExecutor | None = None
+
+
+@cache
+def get_embeddings_client() -> OpenAIEmbeddings:
+    return OpenAIEmbeddings(
+        model=EMBEDDING_MODEL,
+        dimensions=(
+            app_config.embedding_dimensions
+            if app_config.embedding_dimensions != DEFAULT_EMBEDDING_DIMENSIONS
+            else None
+        ),
+    )
+
+
+def get_embedding_executor() -> ThreadPoolExecutor:
+    global embedding_executor
+    if embedding_executor is None:
+        embedding_executor = ThreadPoolExecutor(
+            max_workers=app_config.embedding_max_concurrency
+        )
+    return embedding_executor
+
+
+@cache
+def get_embedding_encoding() -> tiktoken.Encoding:
+    return tiktoken.encoding_for_model(EMBEDDING_MODEL)
+
+
+def build_embedding_batches(texts: list[str]) -> list[list[int]]:
+    encoding = get_embedding_encoding()
+    batches: list[list[int]] = []
+    batch: list[int] = []
+    batch_tokens = 0
+    for index, text in enumerate(texts):
+        tokens = len(encoding.encode_ordinary(text))
+        if batch and (
+            len(batch) >= app_config.embedding_batch_max_inputs
+            or batch_tokens + tokens > app_config.embedding_batch_max_tokens
+        ):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(index)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def embed_batch(texts: list[str]) -> list[list[float]]:
+    return get_embeddings_client().embed_documents(texts, chunk_size=len(texts))
+
+
+def embed_texts(texts: list[str]) -> list[list[float]]:
+    batches = build_embedding_batches(texts)
+    futures = [
+        get_embedding_executor().submit(
+            embed_batch, [texts[index] for index in batch]
+        )
+        for batch in batches
+    ]
+    embeddings: list[list[float]] = [[] for _ in texts]
+    try:
+        for batch, future in zip(batches, futures, strict=True):
+            for index, embedding in zip(batch, future.result(), strict=True):
+                embeddings[index] = embedding
+    except Exception as error:
+        for future in futures:
+            future.cancel()
+        raise EmbeddingGenerationError from error
+    return embeddings
+
+
+async def get_query_embeddings_async(queries: list[str]) -> list[list[float]]:
+    cache_keys = [build_query_key(query) for query in queries]
+    embeddings = await asyncio.to_thread(get_embeddings, cache_keys)
+    missing_indexes = [
+        index for index, embedding in enumerate(embeddings) if embedding is None
+    ]
+    if not missing_indexes:
+        return embeddings
+
+    try:
+        new_embeddings = await get_embeddings_client().aembed_documents(
+            [queries[index] for index in missing_indexes]
+        )
+    except Exception as error:
+        raise EmbeddingGenerationError from error
+    for index, embedding in zip(missing_indexes, new_embeddings, strict=True):
+        embeddings[index] = embedding
+    await asyncio.to_thread(
+        set_embeddings,
+        {cache_keys[index]: embeddings[index] for index in missing_indexes},
+        app_config.embedding_cache_query_ttl_seconds,
+    )
+    return embeddings
+
+
+async def get_query_embedding_async(query: str) -> list[float]:
+    return (await get_query_embeddings_async([query]))[0]
 
 
 def build_embedded_records(
@@ -33,44 +180,80 @@ def build_embedded_records(
     text_splitter = RecursiveCharacterTextSplitter(
         chunk_size=1000,
         chunk_overlap=100,
+        add_start_index=True,
     )
-    records: list[EmbeddedDocument] = []
+    chunks: list[tuple[UUID, LCDocument]] = []
 
     for document_id, text in documents:
-        document = LCDocument(page_content=text)
+        document = LCDocument(page_content=text, metadata={"start_index": 0})
         final_docs = text_splitter.split_documents([document]) or [document]
+        token_counts = count_chunk_tokens(
+            [doc_chunk.page_content for doc_chunk in final_docs],
+            [doc_chunk.metadata["start_index"] for doc_chunk in final_docs],
+        )
 
-        for i, doc_chunk in enumerate(final_docs):
+        for i, (doc_chunk, (token_count, overlap_token_count)) in enumerate(
+            zip(final_docs, token_counts, strict=True)
+        ):
             doc_chunk.metadata["chunk_index"] = i
             doc_chunk.metadata["chunk_count"] = len(final_docs)
+            doc_chunk.metadata["token_count"] = token_count
+            doc_chunk.metadata["overlap_token_count"] = overlap_token_count
+            chunks.append((document_id, doc_chunk))
 
-        contents = [d.page_content for d in final_docs]
-        cache_keys = [build_doc_chunk_key(content) for content in contents]
-        cached_embeddings = get_embeddings(cache_keys)
-        if None in cached_embeddings:
-            try:
-                embeddings = openAIEmbeddings.embed_documents(contents)
-            except Exception as error:
-                raise EmbeddingGenerationError from error
-            for index, embedding in enumerate(embeddings):
-                set_embedding(
-                    cache_keys[index],
-                    embedding,
-                    app_config.embedding_cache_doc_ttl_seconds,
-                )
-        else:
-            embeddings = cached_embeddings
-        records.extend(
-            EmbeddedDocument(
-                content=encrypt(doc_chunk.page_content),
-                metadata_=doc_chunk.metadata or {},
-                document_id=document_id,
-                embedding=embedding,
-            )
-            for doc_chunk, embedding in zip(final_docs, embeddings, strict=True)
+    cache_keys = [
+        build_doc_chunk_key(doc_chunk.page_content) for _, doc_chunk in chunks
+    ]
+    embeddings = get_embeddings(cache_keys)
+    missing_indexes: dict[str, list[int]] = {}
+    for index, embedding in enumerate(embeddings):
+        if embedding is None:
+            missing_indexes.setdefault(cache_keys[index], []).append(index)
+
+    chunk_counts = Counter(document_id for document_id, _ in chunks)
+    miss_counts = Counter(
+        chunks[index][0]
+        for indexes in missing_indexes.values()
+        for index in indexes
+    )
+    for document_id, _ in documents:
+        logger.info(
+            "embedding_cache_lookup",
+            document_id=str(document_id),
+            chunks=chunk_counts[document_id],
+            hits=chunk_counts[document_id] - miss_counts[document_id],
+            misses=miss_counts[document_id],
         )
 
-    return records
+    if missing_indexes:
+        new_embeddings = embed_texts(
+            [
+                chunks[indexes[0]][1].page_content
+                for indexes in missing_indexes.values()
+            ]
+        )
+        for indexes, embedding in zip(
+            missing_indexes.values(), new_embeddings, strict=True
+        ):
+            for index in indexes:
+                embeddings[index] = embedding
+        set_embeddings(
+            dict(zip(missing_indexes, new_embeddings, strict=True)),
+            app_config.embedding_cache_doc_ttl_seconds,
+        )
+
+    contents = encrypt_many([doc_chunk.page_content for _, doc_chunk in chunks])
+    return [
+        EmbeddedDocument(
+            content=content,
+            metadata_=doc_chunk.metadata or {},
+            document_id=document_id,
+            embedding=embedding,
+        )
+        for (document_id, doc_chunk), content, embedding in zip(
+            chunks, contents, embeddings, strict=True
+        )
+    ]
 
 
 def insert_documents(
@@ -103,9 +286,26 @@ def insert_document_chunks(documents: list[tuple[UUID, str]]) -> None:
         return
 
     with Session(engine) as session:
-        session.add_all(records)
+        owner_statement = select(
+            Document.id, Document.session_id, Document.user_id
+        ).where(Document.id.in_({record.document_id for record in records}))
+        owners = {
+            document_id: (session_id, user_id)
+            for document_id, session_id, user_id in session.exec(
+                owner_statement
+            )
+        }
+        for record in records:
+            record.session_id, record.user_id = owners[record.document_id]
+        if app_config.chunk_insert_use_copy:
+            copy_embedded_documents(session, records)
+        else:
+            session.add_all(records)
         session.commit()
 
+    for session_id, user_id in set(owners.values()):
+        bump_scope_version(session_id, user_id)
+
 
 def insert_documents_with_chunks(
     session_id: UUID | None,
@@ -131,70 +331,612 @@ def insert_documents_with_chunks(
     records = build_embedded_records(documents_to_chunk)
     if not records:
         return []
+    for record in records:
+        record.session_id = session_id
+        record.user_id = user_id
 
     with Session(engine) as session:
-        session.add_all(documents)
-        session.add_all(records)
+        if app_config.chunk_insert_use_copy:
+            copy_documents(session, documents)
+            copy_embedded_documents(session, records)
+        else:
+            session.add_all(documents)
+            session.add_all(records)
         session.commit()
         document_ids = [document.id for document in documents]
 
+    bump_scope_version(session_id, user_id)
     return document_ids
 
 
-def get_relevant_documents(
-    query: str,
-    k: int = 5,
-    session_id: UUID | None = None,
-    user_id: UUID | None = None,
-    document_ids: list[UUID] | None = None,
-) -> list[LCDocument]:
+def validate_retrieval_scope(
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID] | None,
+) -> None:
     if document_ids is not None and len(document_ids) == 0:
         raise DocumentIdsEmptyError
 
     if not session_id and not user_id:
         raise ScopeRequiredError
 
+
+def build_document_ids_statement(
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID],
+) -> Select:
+    doc_statement = select(Document.id)
+    if user_id:
+        doc_statement = doc_statement.where(Document.user_id == user_id)
+    else:
+        doc_statement = doc_statement.where(Document.session_id == session_id)
+    return doc_statement.where(Document.id.in_(set(document_ids)))
+
+
+def raise_missing_document_ids(
+    document_ids: list[UUID], existing_ids: set[UUID]
+) -> None:
+    missing_ids = set(document_ids) - existing_ids
+    if missing_ids:
+        raise DocumentIdsNotFoundError(missing_ids)
+
+
+async def ensure_document_ids_exist_async(
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID] | None,
+) -> None:
+    if not document_ids:
+        return
+
+    async with AsyncSession(async_engine) as session:
+        result = await session.exec(
+            build_document_ids_statement(session_id, user_id, document_ids)
+        )
+        existing_ids = set(result.all())
+    raise_missing_document_ids(document_ids, existing_ids)
+
+
+def apply_scope_filter(
+    statement: Select,
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID] | None,
+) -> Select:
+    if user_id:
+        statement = statement.where(EmbeddedDocument.user_id == user_id)
+    else:
+        statement = statement.where(EmbeddedDocument.session_id == session_id)
+
+    if document_ids:
+        statement = statement.where(
+            EmbeddedDocument.document_id.in_(document_ids)
+        )
+
+    return statement
+
+
+def build_search_statement(
+    columns: list,
+    query_embedding: list[float],
+    k: int,
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID] | None,
+) -> Select:
+    distance = EmbeddedDocument.embedding.cosine_distance(
+        query_embedding
+    ).label("distance")
+    statement = apply_scope_filter(
+        select(*columns, distance), session_id, user_id, document_ids
+    ).where(EmbeddedDocument.embedding.is_not(None))
+    return statement.order_by(distance).limit(k)
+
+
+def build_scope_count_statement(
+    limit: int,
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID] | None,
+) -> Select:
+    scope_rows = apply_scope_filter(
+        select(EmbeddedDocument.id), session_id, user_id, document_ids
+    ).limit(limit)
+    return select(func.count()).select_from(scope_rows.subquery())
+
+
+def count_scope_chunks(
+    session: Session,
+    limit: int,
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID] | None,
+) -> int:
+    statement = build_scope_count_statement(
+        limit, session_id, user_id, document_ids
+    )
+    return session.exec(statement).one()
+
+
+def plan_vector_search(
+    search_mode: SearchMode, scope_chunks: int
+) -> tuple[Select, dict]:
+    if scope_chunks <= app_config.vector_search_exact_max_chunks:
+        settings = {"enable_indexscan": "off"}
+        strategy = "exact"
+    else:
+        settings = {
+            "hnsw.ef_search": str(
+                app_config.hnsw_ef_search_recall
+                if search_mode == "recall"
+                else app_config.hnsw_ef_search_latency
+            ),
+            "hnsw.iterative_scan": "strict_order",
+            "hnsw.max_scan_tuples": str(app_config.hnsw_max_scan_tuples),
+        }
+        strategy = "hnsw"
+
+    statement = select(
+        *(
+            func.set_config(name, value, True)
+            for name, value in settings.items()
+        )
+    )
+    return statement, {
+        "strategy": strategy,
+        "search_mode": search_mode,
+        "scope_chunks": scope_chunks,
+    }
+
+
+async def configure_vector_search_async(
+    session: AsyncSession,
+    search_mode: SearchMode,
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID] | None,
+) -> dict:
+    count_result = await session.exec(
+        build_scope_count_statement(
+            app_config.vector_search_exact_max_chunks + 1,
+            session_id,
+            user_id,
+            document_ids,
+        )
+    )
+    statement, search_plan = plan_vector_search(search_mode, count_result.one())
+    await session.exec(statement)
+    return search_plan
+
+
+def log_vector_search(search_plan: dict, rows: int, started_at: float) -> None:
+    logger.info(
+        "vector_search",
+        **search_plan,
+        rows=rows,
+        duration_ms=round((time.perf_counter() - started_at) * 1000, 2),
+    )
+
+
+async def run_vector_search_async(
+    statement: Select | CompoundSelect,
+    search_mode: SearchMode,
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID] | None,
+) -> list:
+    started_at = time.perf_counter()
+    async with AsyncSession(async_engine) as session:
+        search_plan = await configure_vector_search_async(
+            session, search_mode, session_id, user_id, document_ids
+        )
+        results = (await session.exec(statement)).all()
+    log_vector_search(search_plan, len(results), started_at)
+    return results
+
+
+def load_scope_index(
+    session_id: UUID | None, user_id: UUID | None
+) -> ScopeIndex:
+    max_chunks = app_config.in_memory_search_max_chunks
     with Session(engine) as session:
-        if document_ids:
-            requested_ids = set(document_ids)
-            doc_statement = select(Document.id)
-            if user_id:
-                doc_statement = doc_statement.where(Document.user_id == user_id)
-            else:
-                doc_statement = doc_statement.where(
-                    Document.session_id == session_id
-                )
-            doc_statement = doc_statement.where(Document.id.in_(requested_ids))
-            existing_ids = set(session.exec(doc_statement).all())
-            missing_ids = requested_ids - existing_ids
-            if missing_ids:
-                raise DocumentIdsNotFoundError(missing_ids)
-
-        try:
-            query_embedding = openAIEmbeddings.embed_query(query)
-        except Exception as error:
-            raise EmbeddingGenerationError from error
-        statement = select(EmbeddedDocument).join(
-            Document, EmbeddedDocument.document_id == Document.id
-        )
-
-        if user_id:
-            statement = statement.where(Document.user_id == user_id)
-        else:
-            statement = statement.where(Document.session_id == session_id)
+        scope_chunks = count_scope_chunks(
+            session, max_chunks + 1, session_id, user_id, None
+        )
+        if scope_chunks > max_chunks:
+            return OVERSIZED_SCOPE
+        statement = apply_scope_filter(
+            select(
+                EmbeddedDocument.embedding.label("embedding"),
+                EmbeddedDocument.content.label("content"),
+                EmbeddedDocument.metadata_.label("metadata"),
+                EmbeddedDocument.document_id.label("document_id"),
+            ),
+            session_id,
+            user_id,
+            None,
+        )
+        statement = statement.where(
+            EmbeddedDocument.embedding.is_not(None)
+        ).order_by(EmbeddedDocument.id)
+        rows = session.exec(statement).all()
+    return build_scope_index(rows)
 
-        if document_ids:
-            statement = statement.where(Document.id.in_(document_ids))
 
-        statement = statement.order_by(
-            EmbeddedDocument.embedding.cosine_distance(query_embedding)
-        ).limit(k)
-        results = session.exec(statement).all()
+def get_scope_index(
+    session_id: UUID | None, user_id: UUID | None
+) -> ScopeIndex | None:
+    if app_config.in_memory_search_max_chunks <= 0:
+        return None
+    scope_version = get_scope_version(session_id, user_id)
+    if scope_version is None:
+        return None
 
+    scope_key = build_scope_key(session_id, user_id)
+    index = get_cached_scope_index(scope_key, scope_version)
+    if index is None:
+        index = load_scope_index(session_id, user_id)
+        set_cached_scope_index(scope_key, scope_version, index)
+    return None if index is OVERSIZED_SCOPE else index
+
+
+def run_in_memory_search(
+    index: ScopeIndex,
+    query_embeddings: list[list[float]],
+    k: int,
+    document_ids: list[UUID] | None,
+) -> list[list[LCDocument]]:
+    started_at = time.perf_counter()
+    matches = search_scope_index(index, query_embeddings, k, document_ids)
+    logger.info(
+        "vector_search",
+        strategy="in_memory",
+        scope_chunks=len(index.contents),
+        rows=sum(len(query_matches) for query_matches in matches),
+        duration_ms=round((time.perf_counter() - started_at) * 1000, 2),
+    )
+    return build_indexed_lc_documents(index, matches, "distance")
+
+
+def build_lc_documents(
+    chunks: list[tuple[bytes, dict | None, UUID, dict]],
+) -> list[LCDocument]:
+    contents = decrypt_many([content for content, _, _, _ in chunks])
     return [
         LCDocument(
-            page_content=decrypt(row.content),
-            metadata=dict(row.metadata_ or {}),
+            page_content=content,
+            metadata={
+                **(metadata or {}),
+                **scores,
+                "document_id": str(document_id),
+            },
+        )
+        for content, (_, metadata, document_id, scores) in zip(
+            contents, chunks, strict=True
+        )
+    ]
+
+
+def build_row_lc_documents(rows: list) -> list[LCDocument]:
+    return build_lc_documents(
+        [
+            (
+                row.content,
+                row.metadata,
+                row.document_id,
+                {"distance": float(row.distance)},
+            )
+            for row in rows
+        ]
+    )
+
+
+def build_indexed_lc_documents(
+    index: ScopeIndex | LexicalIndex,
+    matches: list[list[tuple[float, int]]],
+    score_key: str,
+) -> list[list[LCDocument]]:
+    documents = iter(
+        build_lc_documents(
+            [
+                (
+                    index.contents[row],
+                    index.metadata[row],
+                    index.document_ids[row],
+                    {score_key: score},
+                )
+                for query_matches in matches
+                for score, row in query_matches
+            ]
+        )
+    )
+    return [
+        [next(documents) for _ in query_matches] for query_matches in matches
+    ]
+
+
+def build_documents_statement(
+    query_embedding: list[float],
+    k: int,
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID] | None,
+) -> Select:
+    return build_search_statement(
+        SEARCH_RESULT_COLUMNS,
+        query_embedding,
+        k,
+        session_id,
+        user_id,
+        document_ids,
+    )
+
+
+def build_documents_batch_statement(
+    query_embeddings: list[list[float]],
+    k: int,
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID] | None,
+) -> CompoundSelect:
+    statements = [
+        build_search_statement(
+            [literal(query_index).label("query_index"), *SEARCH_RESULT_COLUMNS],
+            query_embedding,
+            k,
+            session_id,
+            user_id,
+            document_ids,
+        )
+        for query_index, query_embedding in enumerate(query_embeddings)
+    ]
+    return union_all(*statements)
+
+
+def group_batch_rows(rows: list, query_count: int) -> list[list[LCDocument]]:
+    ordered_rows = sorted(rows, key=lambda row: (row.query_index, row.distance))
+    documents = build_row_lc_documents(ordered_rows)
+    results: list[list[LCDocument]] = [[] for _ in range(query_count)]
+    for row, document in zip(ordered_rows, documents, strict=True):
+        results[row.query_index].append(document)
+    return results
+
+
+async def search_documents_async(
+    query_embedding: list[float],
+    k: int,
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID] | None,
+    search_mode: SearchMode = "latency",
+) -> list[LCDocument]:
+    index = await asyncio.to_thread(get_scope_index, session_id, user_id)
+    if index is not None:
+        return run_in_memory_search(index, [query_embedding], k, document_ids)[
+            0
+        ]
+
+    statement = build_documents_statement(
+        query_embedding, k, session_id, user_id, document_ids
+    )
+    results = await run_vector_search_async(
+        statement, search_mode, session_id, user_id, document_ids
+    )
+    return build_row_lc_documents(results)
+
+
+async def search_documents_batch_async(
+    query_embeddings: list[list[float]],
+    k: int,
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID] | None,
+    search_mode: SearchMode = "latency",
+) -> list[list[LCDocument]]:
+    index = await asyncio.to_thread(get_scope_index, session_id, user_id)
+    if index is not None:
+        return run_in_memory_search(index, query_embeddings, k, document_ids)
+
+    statement = build_documents_batch_statement(
+        query_embeddings, k, session_id, user_id, document_ids
+    )
+    rows = await run_vector_search_async(
+        statement, search_mode, session_id, user_id, document_ids
+    )
+    return group_batch_rows(rows, len(query_embeddings))
+
+
+def load_lexical_index(
+    session_id: UUID | None, user_id: UUID | None
+) -> LexicalIndex:
+    max_chunks = app_config.lexical_search_max_chunks
+    with Session(engine) as session:
+        scope_chunks = count_scope_chunks(
+            session, max_chunks + 1, session_id, user_id, None
+        )
+        if scope_chunks > max_chunks:
+            return OVERSIZED_LEXICAL_SCOPE
+        statement = apply_scope_filter(
+            select(
+                EmbeddedDocument.content.label("content"),
+                EmbeddedDocument.metadata_.label("metadata"),
+                EmbeddedDocument.document_id.label("document_id"),
+            ),
+            session_id,
+            user_id,
+            None,
+        ).order_by(EmbeddedDocument.id)
+        rows = session.exec(statement).all()
+    return build_lexical_index(
+        rows, decrypt_many([row.content for row in rows])
+    )
+
+
+def get_lexical_index(
+    session_id: UUID | None, user_id: UUID | None
+) -> LexicalIndex | None:
+    if not app_config.hybrid_search_enabled:
+        return None
+    scope_version = get_scope_version(session_id, user_id)
+    if scope_version is None:
+        return None
+
+    scope_key = build_scope_key(session_id, user_id)
+    index = get_cached_lexical_index(scope_key, scope_version)
+    if index is None:
+        index = load_lexical_index(session_id, user_id)
+        set_cached_lexical_index(scope_key, scope_version, index)
+    return None if index is OVERSIZED_LEXICAL_SCOPE else index
+
+
+def run_lexical_search(
+    index: LexicalIndex,
+    queries: list[str],
+    k: int,
+    document_ids: list[UUID] | None,
+) -> list[list[LCDocument]]:
+    matches = search_lexical_index(index, queries, k, document_ids)
+    return build_indexed_lc_documents(index, matches, "bm25_score")
+
+
+def fuse_ranked_documents(
+    rankings: list[list[LCDocument]], k: int
+) -> list[LCDocument]:
+    scores: Counter = Counter()
+    documents: dict[tuple, LCDocument] = {}
+    for ranking in rankings:
+        for rank, document in enumerate(ranking, start=1):
+            key = (
+                document.metadata["document_id"],
+                document.metadata.get("chunk_index"),
+            )
+            scores[key] += 1 / (app_config.hybrid_rrf_k + rank)
+            documents.setdefault(key, document)
+    return [documents[key] for key, _ in scores.most_common(k)]
+
+
+def get_search_candidates(k: int, lexical_index: LexicalIndex | None) -> int:
+    if lexical_index is None:
+        return k
+    return max(k, app_config.hybrid_search_candidates)
+
+
+def fuse_hybrid_results(
+    lexical_index: LexicalIndex,
+    queries: list[str],
+    vector_results: list[list[LCDocument]],
+    candidates: int,
+    k: int,
+    document_ids: list[UUID] | None,
+) -> list[list[LCDocument]]:
+    started_at = time.perf_counter()
+    lexical_results = run_lexical_search(
+        lexical_index, queries, candidates, document_ids
+    )
+    fused_results = [
+        fuse_ranked_documents([vector_documents, lexical_documents], k)
+        for vector_documents, lexical_documents in zip(
+            vector_results, lexical_results, strict=True
         )
-        for row in results
     ]
+    logger.info(
+        "hybrid_search",
+        queries=len(queries),
+        candidates=candidates,
+        lexical_rows=sum(len(documents) for documents in lexical_results),
+        duration_ms=round((time.perf_counter() - started_at) * 1000, 2),
+    )
+    return fused_results
+
+
+async def search_documents_hybrid_async(
+    queries: list[str],
+    query_embeddings: list[list[float]],
+    k: int,
+    session_id: UUID | None,
+    user_id: UUID | None,
+    document_ids: list[UUID] | None,
+    search_mode: SearchMode = "latency",
+) -> list[list[LCDocument]]:
+    lexical_index = await asyncio.to_thread(
+        get_lexical_index, session_id, user_id
+    )
+    candidates = get_search_candidates(k, lexical_index)
+
+    if len(query_embeddings) == 1:
+        vector_results = [
+            await search_documents_async(
+                query_embeddings[0],
+                candidates,
+                session_id,
+                user_id,
+                document_ids,
+                search_mode,
+            )
+        ]
+    else:
+        vector_results = await search_documents_batch_async(
+            query_embeddings,
+            candidates,
+            session_id,
+            user_id,
+            document_ids,
+            search_mode,
+        )
+    if lexical_index is None:
+        return vector_results
+    return fuse_hybrid_results(
+        lexical_index, queries, vector_results, candidates, k, document_ids
+    )
+
+
+async def get_relevant_documents_async(
+    query: str,
+    k: int = 5,
+    session_id: UUID | None = None,
+    user_id: UUID | None = None,
+    document_ids: list[UUID] | None = None,
+    search_mode: SearchMode = "latency",
+) -> list[LCDocument]:
+    validate_retrieval_scope(session_id, user_id, document_ids)
+    _, query_embedding = await asyncio.gather(
+        ensure_document_ids_exist_async(session_id, user_id, document_ids),
+        get_query_embedding_async(query),
+    )
+    results = await search_documents_hybrid_async(
+        [query],
+        [query_embedding],
+        k,
+        session_id,
+        user_id,
+        document_ids,
+        search_mode,
+    )
+    return results[0]
+
+
+async def get_relevant_documents_batch_async(
+    queries: list[str],
+    k: int = 5,
+    session_id: UUID | None = None,
+    user_id: UUID | None = None,
+    document_ids: list[UUID] | None = None,
+    search_mode: SearchMode = "latency",
+) -> list[list[LCDocument]]:
+    validate_retrieval_scope(session_id, user_id, document_ids)
+    if not queries:
+        return []
+    _, query_embeddings = await asyncio.gather(
+        ensure_document_ids_exist_async(session_id, user_id, document_ids),
+        get_query_embeddings_async(queries),
+    )
+    return await search_documents_hybrid_async(
+        queries,
+        query_embeddings,
+        k,
+        session_id,
+        user_id,
+        document_ids,
+        search_mode,
+    )
@@ -1,12 +1,30 @@
 import hashlib
 import json
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import redis
 
 from app.config import app_config
+from app.services.local_cache import LocalCache
+
+CACHE_FORMAT_VERSION = 1
+CACHE_DTYPES: dict[str, tuple[int, np.dtype]] = {
+    "float32": (0, np.dtype("<f4")),
+    "float16": (1, np.dtype("<f2")),
+}
+CACHE_DTYPES_BY_CODE = {code: dtype for code, dtype in CACHE_DTYPES.values()}
+LEGACY_JSON_PREFIX = b"["
+DEFAULT_EMBEDDING_DIMENSIONS = 1536
 
 client: redis.Redis | None = None
+write_executor: ThreadPoolExecutor | None = None
+local_cache = LocalCache(
+    max_size=app_config.embedding_local_cache_max_bytes,
+    ttl_seconds=app_config.embedding_local_cache_ttl_seconds,
+    getsizeof=lambda value: value.nbytes,
+)
 
 
 def get_client() -> redis.Redis | None:
@@ -18,14 +36,53 @@ def get_client() -> redis.Redis | None:
     return client
 
 
+def get_write_executor() -> ThreadPoolExecutor:
+    global write_executor
+    if write_executor is None:
+        write_executor = ThreadPoolExecutor(max_workers=1)
+    return write_executor
+
+
+def build_embedding_key(kind: str, text: str) -> str:
+    namespace = f"embeddings:{kind}"
+    if app_config.embedding_dimensions != DEFAULT_EMBEDDING_DIMENSIONS:
+        namespace = f"{namespace}:d{app_config.embedding_dimensions}"
+    return f"{namespace}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+
 def build_doc_chunk_key(text: str) -> str:
-    return f"embeddings:doc:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+    return build_embedding_key("doc", text)
 
 
 def build_query_key(text: str) -> str:
-    return (
-        f"embeddings:query:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
-    )
+    return build_embedding_key("query", text)
+
+
+def encode_embedding(embedding: list[float]) -> bytes:
+    dtype_code, dtype = CACHE_DTYPES[app_config.embedding_cache_dtype]
+    header = bytes((CACHE_FORMAT_VERSION, dtype_code))
+    return header + np.asarray(embedding, dtype=dtype).tobytes()
+
+
+def decode_embedding(value: bytes) -> list[float] | None:
+    if value.startswith(LEGACY_JSON_PREFIX):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return None
+    if len(value) < 2 or value[0] != CACHE_FORMAT_VERSION:
+        return None
+    dtype = CACHE_DTYPES_BY_CODE.get(value[1])
+    if dtype is None:
+        return None
+    try:
+        return np.frombuffer(value, dtype=dtype, offset=2).tolist()
+    except ValueError:
+        return None
+
+
+def get_local_cache_stats() -> dict[str, int]:
+    return local_cache.stats()
 
 
 def get_embeddings(keys: Iterable[str]) -> list[list[float] | None]:
@@ -33,28 +90,69 @@ def get_embeddings(keys: Iterable[str]) -> list[list[float] | None]:
     if not key_list:
         return []
 
+    embeddings: list[list[float] | None] = [None] * len(key_list)
+    missing_indexes: list[int] = []
+    for index, key in enumerate(key_list):
+        local_value = local_cache.get(key)
+        if local_value is None:
+            missing_indexes.append(index)
+        else:
+            embeddings[index] = local_value.tolist()
+    if not missing_indexes:
+        return embeddings
+
     try:
         redis_client = get_client()
         if redis_client is None:
-            return [None] * len(key_list)
-        raw_values = redis_client.mget(key_list)
+            return embeddings
+        raw_values = redis_client.mget(
+            [key_list[index] for index in missing_indexes]
+        )
     except Exception:
-        return [None] * len(key_list)
+        return embeddings
+
+    for index, value in zip(missing_indexes, raw_values, strict=True):
+        embedding = decode_embedding(value) if value else None
+        if embedding is not None:
+            embeddings[index] = embedding
+            set_local_embedding(key_list[index], embedding)
+    return embeddings
+
 
-    return [json.loads(value) if value else None for value in raw_values]
+def set_local_embedding(key: str, embedding: list[float]) -> None:
+    local_cache.set(key, np.asarray(embedding, dtype=np.float32))
 
 
-def set_embedding(
-    key: str, embedding: list[float], ttl_seconds: int | None
+def write_embeddings(
+    payloads: dict[str, bytes], ttl_seconds: int | None
 ) -> None:
-    payload = json.dumps(embedding, separators=(",", ":")).encode("utf-8")
     try:
         redis_client = get_client()
         if redis_client is None:
             return
-        if ttl_seconds and ttl_seconds > 0:
-            redis_client.setex(key, ttl_seconds, payload)
-        else:
-            redis_client.set(key, payload)
+        pipeline = redis_client.pipeline(transaction=False)
+        for key, payload in payloads.items():
+            if ttl_seconds and ttl_seconds > 0:
+                pipeline.setex(key, ttl_seconds, payload)
+            else:
+                pipeline.set(key, payload)
+        pipeline.execute()
     except Exception:
         return
+
+
+def set_embeddings(
+    embeddings: Mapping[str, list[float]], ttl_seconds: int | None
+) -> None:
+    if not embeddings:
+        return
+    for key, embedding in embeddings.items():
+        set_local_embedding(key, embedding)
+    payloads = {
+        key: encode_embedding(embedding)
+        for key, embedding in embeddings.items()
+    }
+    if app_config.embedding_cache_write_in_background:
+        get_write_executor().submit(write_embeddings, payloads, ttl_seconds)
+        return
+    write_embeddings(payloads, ttl_seconds)
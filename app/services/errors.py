@@ -22,5 +22,9 @@ class TextExtractionError(Exception):
     pass
 
 
+class ExtractionUnavailableError(Exception):
+    pass
+
+
 class EmbeddingGenerationError(Exception):
     pass
@@ -1,16 +1,109 @@
+import asyncio
 import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Any
 
-import easyocr
 import fitz
 import numpy as np
 import pymupdf4llm
 from PIL import Image
 
-from app.services.errors import TextExtractionError, UnsupportedContentTypeError
+from app.config import app_config
+from app.services.errors import (
+    ExtractionUnavailableError,
+    TextExtractionError,
+    UnsupportedContentTypeError,
+)
 from app.utils import ErrorMessages
 
-reader = easyocr.Reader(["en"])
+WORKER_READY_POLL_SECONDS = 1
+
+reader = None
+executor: ProcessPoolExecutor | None = None
+workers_ready = None
+
+
+def get_ocr_reader():
+    global reader
+    if reader is None:
+        import easyocr
+
+        reader = easyocr.Reader(["en"])
+    return reader
+
+
+def warm_ocr_reader() -> None:
+    get_ocr_reader()
+
+
+def init_extraction_worker(ready) -> None:
+    try:
+        warm_ocr_reader()
+    finally:
+        ready.release()
+
+
+def get_extraction_executor() -> ProcessPoolExecutor:
+    global executor, workers_ready
+    if executor is None:
+        mp_context = multiprocessing.get_context("spawn")
+        workers_ready = mp_context.Semaphore(0)
+        executor = ProcessPoolExecutor(
+            max_workers=app_config.extraction_max_workers,
+            mp_context=mp_context,
+            initializer=init_extraction_worker,
+            initargs=(workers_ready,),
+        )
+    return executor
+
+
+def wait_for_extraction_workers(
+    pool: ProcessPoolExecutor, ready, count: int
+) -> None:
+    remaining = count
+    while remaining:
+        if ready.acquire(timeout=WORKER_READY_POLL_SECONDS):
+            remaining -= 1
+        else:
+            pool.submit(os.getpid)
+
+
+async def shutdown_extraction_executor() -> None:
+    global executor
+    if executor is None:
+        return
+    pool, executor = executor, None
+    await asyncio.to_thread(pool.shutdown, wait=True)
+
+
+def discard_extraction_executor(broken: ProcessPoolExecutor) -> None:
+    global executor
+    if executor is broken:
+        executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+async def warm_extraction_workers() -> None:
+    loop = asyncio.get_running_loop()
+    pool = get_extraction_executor()
+    worker_count = app_config.extraction_max_workers
+    try:
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, os.getpid)
+                for _ in range(worker_count)
+            )
+        )
+        await asyncio.to_thread(
+            wait_for_extraction_workers, pool, workers_ready, worker_count
+        )
+        await loop.run_in_executor(pool, os.getpid)
+    except BrokenProcessPool:
+        discard_extraction_executor(pool)
+        raise
 
 
 def extract_text_from_pdf(file_bytes: bytes) -> tuple[str, dict[str, Any]]:
@@ -47,7 +140,7 @@ def extract_text_from_image(file_bytes: bytes) -> tuple[str, dict[str, Any]]:
             img_format = img.format
             image = img.convert("RGB")
             image_np = np.array(image)
-            texts = reader.readtext(image_np, detail=0)
+            texts = get_ocr_reader().readtext(image_np, detail=0)
             text = "\n".join(texts)
             return text, {
                 "width": image.width,
@@ -69,3 +162,21 @@ def extract_text(
     raise UnsupportedContentTypeError(
         ErrorMessages.UNSUPPORTED_CONTENT_TYPE.format(content_type=content_type)
     )
+
+
+async def extract_text_async(
+    file_bytes: bytes,
+    content_type: str | None,
+) -> tuple[str, dict[str, Any]]:
+    from app.services.warmup import mark_component_failed
+
+    loop = asyncio.get_running_loop()
+    pool = get_extraction_executor()
+    try:
+        return await loop.run_in_executor(
+            pool, extract_text, file_bytes, content_type
+        )
+    except BrokenProcessPool as error:
+        discard_extraction_executor(pool)
+        mark_component_failed("ocr")
+        raise ExtractionUnavailableError from error
@@ -0,0 +1,178 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, TypeVar
+from uuid import UUID, uuid4
+
+import structlog
+
+from app.config import app_config
+from app.utils import AppError, AppErrorType
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class IngestionJobStatus(Enum):
+    QUEUED = "queued"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class IngestionFileStatus(Enum):
+    QUEUED = "queued"
+    EXTRACTING = "extracting"
+    EXTRACTED = "extracted"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class IngestionJobFile:
+    filename: str
+    status: IngestionFileStatus = IngestionFileStatus.QUEUED
+    document_id: UUID | None = None
+
+
+@dataclass
+class IngestionJob:
+    files: list[IngestionJobFile]
+    session_id: UUID | None
+    user_id: UUID | None
+    id: UUID = field(default_factory=uuid4)
+    status: IngestionJobStatus = IngestionJobStatus.QUEUED
+    document_ids: list[UUID] = field(default_factory=list)
+    error: dict[str, Any] | None = None
+    finished_at: float | None = None
+
+
+IngestionPipeline = Callable[[IngestionJob], Awaitable[list[UUID]]]
+
+jobs: dict[UUID, IngestionJob] = {}
+queue: asyncio.Queue[tuple[IngestionJob, IngestionPipeline, int]] | None = None
+workers: list[asyncio.Task] = []
+queued_bytes = 0
+
+
+def start_ingestion_workers() -> None:
+    global queue, queued_bytes
+    if queue is not None:
+        return
+    queued_bytes = 0
+    queue = asyncio.Queue(maxsize=app_config.ingestion_queue_max_size)
+    workers.extend(
+        asyncio.create_task(run_worker(queue))
+        for _ in range(app_config.ingestion_workers)
+    )
+
+
+async def stop_ingestion_workers() -> None:
+    global queue
+    if queue is None:
+        return
+    pending, queue = queue, None
+    try:
+        await asyncio.wait_for(
+            pending.join(),
+            timeout=app_config.ingestion_shutdown_timeout_seconds,
+        )
+    except TimeoutError:
+        logger.warning("ingestion_drain_timeout", pending_jobs=pending.qsize())
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    workers.clear()
+
+
+def submit_ingestion_job(
+    filenames: list[str],
+    session_id: UUID | None,
+    user_id: UUID | None,
+    pipeline: IngestionPipeline,
+    size_bytes: int,
+) -> IngestionJob:
+    global queued_bytes
+    if (
+        queue is None
+        or queue.full()
+        or queued_bytes + size_bytes > app_config.ingestion_queue_max_bytes
+    ):
+        raise AppError(AppErrorType.INGESTION_QUEUE_FULL)
+
+    prune_finished_jobs()
+    job = IngestionJob(
+        files=[IngestionJobFile(filename=filename) for filename in filenames],
+        session_id=session_id,
+        user_id=user_id,
+    )
+    jobs[job.id] = job
+    queue.put_nowait((job, pipeline, size_bytes))
+    queued_bytes += size_bytes
+    return job
+
+
+def get_ingestion_job(job_id: UUID) -> IngestionJob | None:
+    return jobs.get(job_id)
+
+
+def prune_finished_jobs() -> None:
+    cutoff = time.monotonic() - app_config.ingestion_job_ttl_seconds
+    expired_ids = [
+        job_id
+        for job_id, job in jobs.items()
+        if job.finished_at is not None and job.finished_at <= cutoff
+    ]
+    for job_id in expired_ids:
+        del jobs[job_id]
+
+
+async def track_file_extraction(
+    job: IngestionJob, index: int, extraction: Awaitable[T]
+) -> T:
+    job_file = job.files[index]
+    job_file.status = IngestionFileStatus.EXTRACTING
+    try:
+        result = await extraction
+    except Exception:
+        job_file.status = IngestionFileStatus.FAILED
+        raise
+    job_file.status = IngestionFileStatus.EXTRACTED
+    return result
+
+
+async def run_worker(
+    pending: asyncio.Queue[tuple[IngestionJob, IngestionPipeline, int]],
+) -> None:
+    global queued_bytes
+    while True:
+        job, pipeline, size_bytes = await pending.get()
+        try:
+            await run_job(job, pipeline)
+        finally:
+            del pipeline
+            queued_bytes -= size_bytes
+            pending.task_done()
+
+
+async def run_job(job: IngestionJob, pipeline: IngestionPipeline) -> None:
+    job.status = IngestionJobStatus.PROCESSING
+    try:
+        document_ids = await pipeline(job)
+    except AppError as error:
+        job.status = IngestionJobStatus.FAILED
+        job.error = error.body
+    except Exception:
+        logger.exception("ingestion_job_failed", job_id=str(job.id))
+        job.status = IngestionJobStatus.FAILED
+        job.error = AppError(AppErrorType.INGESTION_FAILED).body
+    else:
+        job.status = IngestionJobStatus.COMPLETED
+        job.document_ids = document_ids
+        for job_file, document_id in zip(job.files, document_ids):
+            job_file.status = IngestionFileStatus.COMPLETED
+            job_file.document_id = document_id
+    job.finished_at = time.monotonic()
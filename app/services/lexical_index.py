@@ -0,0 +1,155 @@
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from uuid import UUID
+
+import numpy as np
+
+from app.config import app_config
+from app.services.local_cache import LocalCache
+
+TOKEN_PATTERN = re.compile(r"\w+")
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+@dataclass
+class LexicalIndex:
+    postings: dict[str, tuple[np.ndarray, np.ndarray]]
+    document_lengths: np.ndarray
+    contents: list[str]
+    metadata: list[dict | None]
+    document_ids: list[UUID]
+    document_rows: dict[UUID, np.ndarray] = field(default_factory=dict)
+    nbytes: int = 0
+
+
+OVERSIZED_LEXICAL_SCOPE = LexicalIndex(
+    postings={},
+    document_lengths=np.empty(0, dtype=np.float32),
+    contents=[],
+    metadata=[],
+    document_ids=[],
+)
+
+lexical_index_cache = LocalCache(
+    max_size=app_config.lexical_search_cache_max_bytes,
+    ttl_seconds=app_config.lexical_search_cache_ttl_seconds,
+    getsizeof=lambda index: index.nbytes,
+)
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def build_lexical_index(rows: list, texts: list[str]) -> LexicalIndex:
+    term_rows: dict[str, list[int]] = {}
+    term_frequencies: dict[str, list[int]] = {}
+    document_lengths = np.zeros(len(texts), dtype=np.float32)
+    for position, text in enumerate(texts):
+        tokens = tokenize(text)
+        document_lengths[position] = len(tokens)
+        for term, frequency in Counter(tokens).items():
+            term_rows.setdefault(term, []).append(position)
+            term_frequencies.setdefault(term, []).append(frequency)
+
+    postings = {
+        term: (
+            np.asarray(positions, dtype=np.intp),
+            np.asarray(term_frequencies[term], dtype=np.float32),
+        )
+        for term, positions in term_rows.items()
+    }
+
+    document_ids = [row.document_id for row in rows]
+    positions_by_document: dict[UUID, list[int]] = {}
+    for position, document_id in enumerate(document_ids):
+        positions_by_document.setdefault(document_id, []).append(position)
+
+    contents = [row.content for row in rows]
+    return LexicalIndex(
+        postings=postings,
+        document_lengths=document_lengths,
+        contents=contents,
+        metadata=[row.metadata for row in rows],
+        document_ids=document_ids,
+        document_rows={
+            document_id: np.asarray(positions, dtype=np.intp)
+            for document_id, positions in positions_by_document.items()
+        },
+        nbytes=sum(
+            len(term) + term_positions.nbytes + frequencies.nbytes
+            for term, (term_positions, frequencies) in postings.items()
+        )
+        + document_lengths.nbytes
+        + sum(len(content) for content in contents),
+    )
+
+
+def get_cached_lexical_index(
+    scope_key: str, version: int
+) -> LexicalIndex | None:
+    return lexical_index_cache.get((scope_key, version))
+
+
+def set_cached_lexical_index(
+    scope_key: str, version: int, index: LexicalIndex
+) -> None:
+    lexical_index_cache.set((scope_key, version), index)
+
+
+def get_lexical_index_stats() -> dict[str, int]:
+    return lexical_index_cache.stats()
+
+
+def search_lexical_index(
+    index: LexicalIndex,
+    queries: list[str],
+    k: int,
+    document_ids: list[UUID] | None,
+) -> list[list[tuple[float, int]]]:
+    row_count = len(index.contents)
+    if row_count == 0:
+        return [[] for _ in queries]
+
+    allowed_rows = None
+    if document_ids:
+        allowed_rows = np.zeros(row_count, dtype=bool)
+        for document_id in document_ids:
+            if document_id in index.document_rows:
+                allowed_rows[index.document_rows[document_id]] = True
+
+    length_norms = BM25_K1 * (
+        1
+        - BM25_B
+        + BM25_B
+        * index.document_lengths
+        / max(float(index.document_lengths.mean()), 1.0)
+    )
+
+    results: list[list[tuple[float, int]]] = []
+    for query in queries:
+        scores = np.zeros(row_count, dtype=np.float32)
+        for term in set(tokenize(query)):
+            posting = index.postings.get(term)
+            if posting is None:
+                continue
+            positions, frequencies = posting
+            idf = math.log(
+                1 + (row_count - len(positions) + 0.5) / (len(positions) + 0.5)
+            )
+            scores[positions] += (
+                idf
+                * frequencies
+                * (BM25_K1 + 1)
+                / (frequencies + length_norms[positions])
+            )
+        if allowed_rows is not None:
+            scores[~allowed_rows] = 0
+
+        matched = np.flatnonzero(scores > 0)
+        top = matched[np.argsort(-scores[matched], kind="stable")[:k]]
+        results.append([(float(scores[row]), int(row)) for row in top])
+    return results
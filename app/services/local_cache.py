@@ -0,0 +1,66 @@
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from cachetools import TTLCache
+
+
+class EvictionCountingTTLCache(TTLCache):
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        getsizeof: Callable[[Any], int] | None = None,
+    ) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl, getsizeof=getsizeof)
+        self.evictions = 0
+
+    def popitem(self) -> tuple[Hashable, Any]:
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+
+class LocalCache:
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        getsizeof: Callable[[Any], int] | None = None,
+    ) -> None:
+        self.cache = EvictionCountingTTLCache(
+            maxsize=max_size, ttl=ttl_seconds, getsizeof=getsizeof
+        )
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        with self.lock:
+            value = self.cache.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self.lock:
+            try:
+                self.cache[key] = value
+            except ValueError:
+                return
+
+    def clear(self) -> None:
+        with self.lock:
+            self.cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.cache.evictions,
+                "items": len(self.cache),
+                "size": int(self.cache.currsize),
+            }
@@ -1,4 +1,6 @@
 import json
+from collections.abc import AsyncIterator
+from functools import cache
 
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field, ValidationError
@@ -19,9 +21,24 @@ Return ONLY valid JSON with this shape:
 """
 
 
-def build_qa_message(context: str, question: str) -> list[tuple[str, str]]:
+QA_STREAM_SYSTEM_PROMPT = f"""# Your Role
+You are a document Q&A assistant. Answer using ONLY the provided context.
+
+# Your Task
+1. Answer the user's question using the context.
+2. If the answer is not in the context, respond with exactly:
+{NO_ANSWER_TEXT}
+
+# Response Format
+Return ONLY the answer text, without JSON or any other wrapping.
+"""
+
+
+def build_qa_message(
+    context: str, question: str, system_prompt: str = QA_SYSTEM_PROMPT
+) -> list[tuple[str, str]]:
     user_prompt = f"Context:\n{context}\n\nQuestion: {question}"
-    return [("system", QA_SYSTEM_PROMPT), ("human", user_prompt)]
+    return [("system", system_prompt), ("human", user_prompt)]
 
 
 QA_JSON_SCHEMA = {
@@ -41,31 +58,25 @@ QA_RESPONSE_FORMAT = {
     "json_schema": QA_JSON_SCHEMA,
 }
 
-model = ChatOpenAI(
-    model="gpt-4.1",
-    temperature=0.3,
-    top_p=1,
-)
+QA_MODEL = "gpt-4.1"
+
+
+@cache
+def get_qa_model() -> ChatOpenAI:
+    return ChatOpenAI(
+        model=QA_MODEL,
+        temperature=0.3,
+        top_p=1,
+    )
 
 
 class QAResponseSchema(BaseModel):
     answer: str = Field(description="Final answer based on the context.")
 
 
-def answer_question(question: str, context: str) -> str:
+def parse_answer(response_content: str) -> str:
     try:
-        qa_message_prompt = build_qa_message(context, question)
-        response = model.invoke(
-            qa_message_prompt,
-            response_format=QA_RESPONSE_FORMAT,
-        )
-        print(response.response_metadata)
-    except Exception:
-        return NO_ANSWER_TEXT
-
-    response_payload = str(response.content)
-    try:
-        payload = json.loads(response_payload)
+        payload = json.loads(response_content)
         parsed = QAResponseSchema.model_validate(payload)
     except (json.JSONDecodeError, ValidationError):
         return NO_ANSWER_TEXT
@@ -75,3 +86,24 @@ def answer_question(question: str, context: str) -> str:
         return NO_ANSWER_TEXT
 
     return answer
+
+
+async def answer_question_async(question: str, context: str) -> str:
+    try:
+        response = await get_qa_model().ainvoke(
+            build_qa_message(context, question),
+            response_format=QA_RESPONSE_FORMAT,
+        )
+    except Exception:
+        return NO_ANSWER_TEXT
+
+    return parse_answer(str(response.content))
+
+
+async def stream_answer(question: str, context: str) -> AsyncIterator[str]:
+    qa_message_prompt = build_qa_message(
+        context, question, system_prompt=QA_STREAM_SYSTEM_PROMPT
+    )
+    async for chunk in get_qa_model().astream(qa_message_prompt):
+        if chunk.content:
+            yield str(chunk.content)
@@ -1,8 +1,13 @@
 import json
+from collections import Counter
+from functools import cache
 
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, ValidationError
 
+from app.config import app_config
+from app.services.local_cache import LocalCache
+
 QUESTION_CLASSIFIER_SYSTEM_PROMPT = """# Your Role
 You validate user questions for a document Q&A system.
 
@@ -39,34 +44,124 @@ QUESTION_CLASSIFIER_RESPONSE_FORMAT = {
     "json_schema": QUESTION_CLASSIFIER_SCHEMA,
 }
 
-model = ChatOpenAI(
-    model="gpt-4.1",
-    temperature=0,
-    top_p=1,
+PLACEHOLDER_QUESTIONS = {
+    "string",
+    "test",
+    "testing",
+    "test question",
+    "question",
+    "asdf",
+    "qwerty",
+    "foo",
+    "bar",
+    "foobar",
+    "lorem ipsum",
+    "hello",
+    "hi",
+    "hey",
+    "null",
+    "none",
+    "undefined",
+    "example",
+    "sample",
+}
+TRAILING_PUNCTUATION = "?!.,;: "
+MIN_QUESTION_LETTERS = 3
+
+verdict_cache = LocalCache(
+    max_size=app_config.question_classifier_cache_max_items,
+    ttl_seconds=app_config.question_classifier_cache_ttl_seconds,
 )
+classifier_stats: Counter[str] = Counter()
 
 
 class QuestionClassifierResult(BaseModel):
     is_valid: bool
 
 
+@cache
+def get_classifier_model() -> ChatOpenAI:
+    return ChatOpenAI(
+        model="gpt-4.1",
+        temperature=0,
+        top_p=1,
+    )
+
+
 def build_classifier_message(question: str) -> list[tuple[str, str]]:
     return [("system", QUESTION_CLASSIFIER_SYSTEM_PROMPT), ("human", question)]
 
 
-def classify_question(question: str) -> QuestionClassifierResult:
+def normalize_classifier_question(question: str) -> str:
+    return " ".join(question.lower().split()).strip(TRAILING_PUNCTUATION)
+
+
+def classify_locally(
+    normalized_question: str,
+) -> QuestionClassifierResult | None:
+    letters = sum(char.isalpha() for char in normalized_question)
+    if letters < MIN_QUESTION_LETTERS:
+        return QuestionClassifierResult(is_valid=False)
+    if normalized_question in PLACEHOLDER_QUESTIONS:
+        return QuestionClassifierResult(is_valid=False)
+    return None
+
+
+def parse_classification(
+    response_content: str,
+) -> QuestionClassifierResult | None:
     try:
-        response = model.invoke(
+        payload = json.loads(response_content)
+        return QuestionClassifierResult.model_validate(payload)
+    except (json.JSONDecodeError, ValidationError):
+        return None
+
+
+def get_precomputed_verdict(
+    normalized_question: str,
+) -> QuestionClassifierResult | None:
+    local_verdict = classify_locally(normalized_question)
+    if local_verdict is not None:
+        classifier_stats["rules"] += 1
+        return local_verdict
+    cached_verdict = verdict_cache.get(normalized_question)
+    if cached_verdict is not None:
+        classifier_stats["cache"] += 1
+        return cached_verdict
+    classifier_stats["llm"] += 1
+    return None
+
+
+def store_llm_verdict(
+    normalized_question: str, response_content: str
+) -> QuestionClassifierResult:
+    parsed = parse_classification(response_content)
+    if parsed is None:
+        return QuestionClassifierResult(is_valid=True)
+    verdict_cache.set(normalized_question, parsed)
+    return parsed
+
+
+def get_classifier_stats() -> dict[str, int]:
+    return {
+        "rules": classifier_stats["rules"],
+        "cache": classifier_stats["cache"],
+        "llm": classifier_stats["llm"],
+    }
+
+
+async def classify_question_async(question: str) -> QuestionClassifierResult:
+    normalized_question = normalize_classifier_question(question)
+    verdict = get_precomputed_verdict(normalized_question)
+    if verdict is not None:
+        return verdict
+
+    try:
+        response = await get_classifier_model().ainvoke(
             build_classifier_message(question),
             response_format=QUESTION_CLASSIFIER_RESPONSE_FORMAT,
         )
     except Exception:
         return QuestionClassifierResult(is_valid=True)
 
-    try:
-        payload = json.loads(str(response.content))
-        parsed = QuestionClassifierResult.model_validate(payload)
-    except (json.JSONDecodeError, ValidationError):
-        return QuestionClassifierResult(is_valid=True)
-
-    return parsed
+    return store_llm_verdict(normalized_question, str(response.content))
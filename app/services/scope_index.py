@@ -0,0 +1,126 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+import numpy as np
+from pgvector import HalfVector
+
+from app.config import app_config
+from app.services.local_cache import LocalCache
+
+
+@dataclass
+class ScopeIndex:
+    embeddings: np.ndarray
+    contents: list[str]
+    metadata: list[dict | None]
+    document_ids: list[UUID]
+    document_rows: dict[UUID, np.ndarray] = field(default_factory=dict)
+    nbytes: int = 0
+
+
+OVERSIZED_SCOPE = ScopeIndex(
+    embeddings=np.empty((0, 0), dtype=np.float32),
+    contents=[],
+    metadata=[],
+    document_ids=[],
+)
+
+scope_index_cache = LocalCache(
+    max_size=app_config.in_memory_search_cache_max_bytes,
+    ttl_seconds=app_config.in_memory_search_cache_ttl_seconds,
+    getsizeof=lambda index: index.nbytes,
+)
+
+
+def to_float32(embedding) -> np.ndarray:
+    if isinstance(embedding, HalfVector):
+        embedding = embedding.to_numpy()
+    return np.asarray(embedding, dtype=np.float32)
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return matrix / norms
+
+
+def build_scope_index(rows: list) -> ScopeIndex:
+    if not rows:
+        embeddings = np.empty((0, app_config.embedding_dimensions), np.float32)
+    else:
+        embeddings = np.stack([to_float32(row.embedding) for row in rows])
+    embeddings = np.ascontiguousarray(normalize_rows(embeddings))
+
+    document_ids = [row.document_id for row in rows]
+    positions: dict[UUID, list[int]] = {}
+    for position, document_id in enumerate(document_ids):
+        positions.setdefault(document_id, []).append(position)
+
+    contents = [row.content for row in rows]
+    return ScopeIndex(
+        embeddings=embeddings,
+        contents=contents,
+        metadata=[row.metadata for row in rows],
+        document_ids=document_ids,
+        document_rows={
+            document_id: np.asarray(indexes, dtype=np.intp)
+            for document_id, indexes in positions.items()
+        },
+        nbytes=embeddings.nbytes + sum(len(content) for content in contents),
+    )
+
+
+def get_cached_scope_index(scope_key: str, version: int) -> ScopeIndex | None:
+    return scope_index_cache.get((scope_key, version))
+
+
+def set_cached_scope_index(
+    scope_key: str, version: int, index: ScopeIndex
+) -> None:
+    scope_index_cache.set((scope_key, version), index)
+
+
+def get_scope_index_stats() -> dict[str, int]:
+    return scope_index_cache.stats()
+
+
+def search_scope_index(
+    index: ScopeIndex,
+    query_embeddings: list[list[float]],
+    k: int,
+    document_ids: list[UUID] | None,
+) -> list[list[tuple[float, int]]]:
+    if document_ids:
+        candidate_rows = [
+            index.document_rows[document_id]
+            for document_id in dict.fromkeys(document_ids)
+            if document_id in index.document_rows
+        ]
+        rows = (
+            np.concatenate(candidate_rows)
+            if candidate_rows
+            else np.empty(0, dtype=np.intp)
+        )
+        embeddings = index.embeddings[rows]
+    else:
+        rows = np.arange(len(index.contents))
+        embeddings = index.embeddings
+
+    top_k = min(k, len(rows))
+    if top_k == 0:
+        return [[] for _ in query_embeddings]
+
+    queries = normalize_rows(np.asarray(query_embeddings, dtype=np.float32))
+    similarities = embeddings @ queries.T
+
+    results: list[list[tuple[float, int]]] = []
+    for column in similarities.T:
+        top = np.argpartition(-column, top_k - 1)[:top_k]
+        top = top[np.argsort(-column[top], kind="stable")]
+        results.append(
+            [
+                (1 - float(column[position]), int(rows[position]))
+                for position in top
+            ]
+        )
+    return results
@@ -2,29 +2,74 @@ from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 from sqlmodel import Session as SQLModelSession, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.config import app_config
-from app.database import engine
+from app.database import async_engine, engine
 from app.models import Session as SessionModel
+from app.utils import (
+    AppError,
+    AppErrorType,
+    parse_session_token,
+    sign_session_token,
+)
 
 
-def create_session() -> SessionModel:
+def build_session_record() -> SessionModel:
     expires_at = datetime.now(UTC) + timedelta(
         minutes=app_config.session_expires_minutes
     )
+    return SessionModel(expires_at=expires_at)
+
+
+def create_session() -> SessionModel:
     with SQLModelSession(engine) as session:
-        record = SessionModel(expires_at=expires_at)
+        record = build_session_record()
         session.add(record)
         session.commit()
         session.refresh(record)
         return record
 
 
+async def create_session_async() -> SessionModel:
+    async with AsyncSession(async_engine) as session:
+        record = build_session_record()
+        session.add(record)
+        await session.commit()
+        await session.refresh(record)
+        return record
+
+
 def get_session(session_id: UUID) -> SessionModel | None:
     with SQLModelSession(engine) as session:
         statement = select(SessionModel).where(SessionModel.id == session_id)
         return session.exec(statement).first()
 
 
+async def get_session_async(session_id: UUID) -> SessionModel | None:
+    async with AsyncSession(async_engine) as session:
+        statement = select(SessionModel).where(SessionModel.id == session_id)
+        return (await session.exec(statement)).first()
+
+
 def is_session_expired(record: SessionModel) -> bool:
     return record.expires_at <= datetime.now(UTC)
+
+
+def build_session_token(record: SessionModel) -> str:
+    return sign_session_token(record.id, record.expires_at)
+
+
+async def resolve_session_token(token: str) -> tuple[UUID, str]:
+    session_token = parse_session_token(token)
+    if session_token.is_signed:
+        if session_token.expires_at <= datetime.now(UTC):
+            raise AppError(AppErrorType.SESSION_EXPIRED)
+        return session_token.session_id, token.strip()
+
+    session_record = await get_session_async(session_token.session_id)
+    if not session_record:
+        raise AppError(AppErrorType.SESSION_NOT_FOUND)
+    if is_session_expired(session_record):
+        raise AppError(AppErrorType.SESSION_EXPIRED)
+    return session_record.id, build_session_token(session_record)
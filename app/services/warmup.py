@@ -0,0 +1,135 @@
+import asyncio
+import time
+from contextlib import contextmanager, suppress
+
+import structlog
+from sqlalchemy import text
+
+from app.config import app_config
+from app.database import async_engine, engine
+from app.services.context_builder import get_context_encoding
+from app.services.document_store import (
+    get_embedding_encoding,
+    get_embeddings_client,
+)
+from app.services.extract import warm_extraction_workers
+from app.services.qa import get_qa_model
+from app.services.question_classifier import get_classifier_model
+
+logger = structlog.get_logger(__name__)
+
+PENDING = "pending"
+READY = "ready"
+FAILED = "failed"
+LAZY = "lazy"
+
+READINESS_COMPONENTS = ("database", "ocr")
+READINESS_DATABASE_TIMEOUT_SECONDS = 5
+INITIAL_STATE = PENDING if app_config.warm_up_on_startup else LAZY
+
+component_states: dict[str, str] = {
+    "database": INITIAL_STATE,
+    "ocr": INITIAL_STATE,
+    "models": LAZY,
+}
+startup_timings: dict[str, float] = {}
+warm_up_tasks: dict[str, asyncio.Task] = {}
+
+
+@contextmanager
+def time_startup_phase(phase: str):
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration_ms = round((time.perf_counter() - started_at) * 1000, 2)
+        startup_timings[phase] = duration_ms
+        logger.info("startup_phase", phase=phase, duration_ms=duration_ms)
+
+
+def ping_database() -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+async def warm_database() -> None:
+    async with async_engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+    await asyncio.to_thread(ping_database)
+
+
+def load_models() -> None:
+    get_embeddings_client()
+    get_qa_model()
+    get_classifier_model()
+    get_embedding_encoding()
+    get_context_encoding()
+
+
+async def warm_models() -> None:
+    await asyncio.to_thread(load_models)
+
+
+async def warm_component(name: str, warm) -> None:
+    component_states[name] = PENDING
+    try:
+        with time_startup_phase(f"warm_{name}"):
+            await warm()
+    except Exception:
+        component_states[name] = FAILED
+        logger.exception("startup_warm_up_failed", component=name)
+        return
+    component_states[name] = READY
+
+
+def mark_component_failed(name: str) -> None:
+    component_states[name] = FAILED
+
+
+WARM_UP_STEPS = {
+    "database": warm_database,
+    "ocr": warm_extraction_workers,
+    "models": warm_models,
+}
+
+
+def schedule_warm_up(name: str) -> asyncio.Task:
+    task = warm_up_tasks.get(name)
+    if task is None or task.done():
+        task = asyncio.create_task(warm_component(name, WARM_UP_STEPS[name]))
+        warm_up_tasks[name] = task
+    return task
+
+
+async def warm_up() -> None:
+    with time_startup_phase("warm_up"):
+        await asyncio.gather(
+            *(schedule_warm_up(name) for name in WARM_UP_STEPS)
+        )
+
+
+async def stop_warm_up() -> None:
+    tasks = [task for task in warm_up_tasks.values() if not task.done()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def get_readiness() -> dict:
+    for name in READINESS_COMPONENTS:
+        if component_states[name] in (LAZY, FAILED):
+            schedule_warm_up(name)
+    database_task = warm_up_tasks.get("database")
+    if component_states["database"] != READY and database_task is not None:
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                asyncio.shield(database_task),
+                READINESS_DATABASE_TIMEOUT_SECONDS,
+            )
+    return {
+        "ready": all(
+            component_states[name] == READY for name in READINESS_COMPONENTS
+        ),
+        "components": dict(component_states),
+        "startup_ms": dict(startup_timings),
+    }
@@ -9,7 +9,13 @@ from .messages import ErrorMessages, ResponseMessages, ValidationMessages
 from .rate_limit import limiter, get_user_id_from_request
 from .validators import dedupe_document_ids, normalize_question
 from .logging import configure_logging
-from .encryption import encrypt, decrypt
+from .encryption import decrypt, decrypt_many, encrypt, encrypt_many
+from .sse import format_sse_event
+from .session_signing import (
+    SessionToken,
+    parse_session_token,
+    sign_session_token,
+)
 
 __all__ = [
     "AppError",
@@ -28,4 +34,10 @@ __all__ = [
     "configure_logging",
     "encrypt",
     "decrypt",
+    "encrypt_many",
+    "decrypt_many",
+    "format_sse_event",
+    "SessionToken",
+    "parse_session_token",
+    "sign_session_token",
 ]
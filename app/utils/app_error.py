@@ -11,6 +11,7 @@ class AppErrorType(Enum):
     SESSION_ID_NOT_ALLOWED = "session_id_not_allowed"
     SESSION_NOT_FOUND = "session_not_found"
     SESSION_EXPIRED = "session_expired"
+    SESSION_TOKEN_INVALID = "session_token_invalid"
     QUESTION_INVALID = "question_invalid"
     NO_RELEVANT_CONTEXT = "no_relevant_context"
     DOCUMENT_IDS_NOT_FOUND = "document_ids_not_found"
@@ -22,6 +23,7 @@ class AppErrorType(Enum):
     EMPTY_FILE = "empty_file"
     FILE_TOO_LARGE = "file_too_large"
     NO_TEXT_EXTRACTED = "no_text_extracted"
+    EXTRACTION_UNAVAILABLE = "extraction_unavailable"
     EMBEDDING_FAILED = "embedding_failed"
     DATA_ENCRYPTION_KEY_INVALID = "data_encryption_key_invalid"
     DATA_ENCRYPTION_FAILED = "data_encryption_failed"
@@ -29,6 +31,9 @@ class AppErrorType(Enum):
     JWT_SECRET_MISSING = "jwt_secret_missing"
     TOKEN_MISSING_USER_ID = "token_missing_user_id"
     TOKEN_INVALID = "token_invalid"
+    JOB_NOT_FOUND = "job_not_found"
+    INGESTION_QUEUE_FULL = "ingestion_queue_full"
+    INGESTION_FAILED = "ingestion_failed"
 
 
 @dataclass(frozen=True)
@@ -59,6 +64,11 @@ _APP_ERROR_TEMPLATES: dict[AppErrorType, AppErrorTemplate] = {
         message="Invalid token",
         code="401-04",
     ),
+    AppErrorType.SESSION_TOKEN_INVALID: AppErrorTemplate(
+        http_status_code=status.HTTP_401_UNAUTHORIZED,
+        message="Invalid session token",
+        code="401-05",
+    ),
     AppErrorType.SESSION_ID_REQUIRED: AppErrorTemplate(
         http_status_code=status.HTTP_400_BAD_REQUEST,
         message="session_id is required for anonymous requests",
@@ -109,6 +119,11 @@ _APP_ERROR_TEMPLATES: dict[AppErrorType, AppErrorTemplate] = {
         message="One or more document_ids were not found for this request",
         code="404-03",
     ),
+    AppErrorType.JOB_NOT_FOUND: AppErrorTemplate(
+        http_status_code=status.HTTP_404_NOT_FOUND,
+        message="Job not found",
+        code="404-04",
+    ),
     AppErrorType.DOCUMENT_IDS_EMPTY: AppErrorTemplate(
         http_status_code=status.HTTP_400_BAD_REQUEST,
         message="document_ids cannot be an empty list",
@@ -154,6 +169,21 @@ _APP_ERROR_TEMPLATES: dict[AppErrorType, AppErrorTemplate] = {
         message="Document content decryption failed",
         code="500-05",
     ),
+    AppErrorType.INGESTION_FAILED: AppErrorTemplate(
+        http_status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        message="Document ingestion failed",
+        code="500-06",
+    ),
+    AppErrorType.INGESTION_QUEUE_FULL: AppErrorTemplate(
+        http_status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        message="Ingestion queue is full, try again later",
+        code="503-01",
+    ),
+    AppErrorType.EXTRACTION_UNAVAILABLE: AppErrorTemplate(
+        http_status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        message="Text extraction is temporarily unavailable, try again later",
+        code="503-02",
+    ),
     AppErrorType.JWT_SECRET_MISSING: AppErrorTemplate(
         http_status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         message="JWT_SECRET is not set",
@@ -1,4 +1,5 @@
 import secrets
+from functools import cache
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
@@ -8,6 +9,8 @@ from app.utils.app_error import AppError, AppErrorType
 KEY_LENGTH_BYTES = 32
 GCM_NONCE_LENGTH_BYTES = 12
 SEPARATOR = "."
+PLAINTEXT_FORMAT_VERSION = 0
+AESGCM_FORMAT_VERSION = 1
 
 
 def get_key_bytes() -> bytes:
@@ -20,6 +23,11 @@ def get_key_bytes() -> bytes:
     return key_bytes
 
 
+@cache
+def get_cipher() -> AESGCM:
+    return AESGCM(get_key_bytes())
+
+
 def parse_payload(value: str) -> tuple[bytes, bytes] | None:
     if SEPARATOR not in value:
         return None
@@ -32,32 +40,66 @@ def parse_payload(value: str) -> tuple[bytes, bytes] | None:
         return None
 
 
-def encrypt(value: str) -> str:
-    if not value:
-        return value
-    key_bytes = get_key_bytes()
+def encrypt_with(cipher: AESGCM, value: str) -> bytes:
     nonce = secrets.token_bytes(GCM_NONCE_LENGTH_BYTES)
     try:
-        ciphertext = AESGCM(key_bytes).encrypt(
-            nonce, value.encode("utf-8"), None
-        )
+        ciphertext = cipher.encrypt(nonce, value.encode("utf-8"), None)
     except Exception as error:
         raise AppError(AppErrorType.DATA_ENCRYPTION_FAILED) from error
-    return f"{ciphertext.hex()}{SEPARATOR}{nonce.hex()}"
+    return bytes([AESGCM_FORMAT_VERSION]) + nonce + ciphertext
+
+
+def decrypt_with(cipher: AESGCM, value: bytes) -> str:
+    if not value:
+        return ""
+    version, payload = value[0], value[1:]
+    try:
+        if version == PLAINTEXT_FORMAT_VERSION:
+            return payload.decode("utf-8")
+        if version != AESGCM_FORMAT_VERSION:
+            raise ValueError(f"Unsupported encryption format {version}")
+        nonce = payload[:GCM_NONCE_LENGTH_BYTES]
+        ciphertext = payload[GCM_NONCE_LENGTH_BYTES:]
+        return cipher.decrypt(nonce, ciphertext, None).decode("utf-8")
+    except Exception as error:
+        raise AppError(AppErrorType.DATA_DECRYPTION_FAILED) from error
 
 
-def decrypt(value: str) -> str:
+def decrypt_text(value: str) -> str:
     if not value:
         return value
     payload = parse_payload(value)
     if payload is None:
         return value
     ciphertext, nonce = payload
-    key_bytes = get_key_bytes()
+    if len(nonce) != GCM_NONCE_LENGTH_BYTES:
+        return value
     try:
-        if len(nonce) != GCM_NONCE_LENGTH_BYTES:
-            return value
-        plaintext = AESGCM(key_bytes).decrypt(nonce, ciphertext, None)
+        plaintext = get_cipher().decrypt(nonce, ciphertext, None)
         return plaintext.decode("utf-8")
     except Exception as error:
         raise AppError(AppErrorType.DATA_DECRYPTION_FAILED) from error
+
+
+def encrypt(value: str) -> bytes:
+    return encrypt_with(get_cipher(), value)
+
+
+def decrypt(value: bytes | str) -> str:
+    if isinstance(value, str):
+        return decrypt_text(value)
+    return decrypt_with(get_cipher(), value)
+
+
+def encrypt_many(values: list[str]) -> list[bytes]:
+    if not values:
+        return []
+    cipher = get_cipher()
+    return [encrypt_with(cipher, value) for value in values]
+
+
+def decrypt_many(values: list[bytes]) -> list[str]:
+    if not values:
+        return []
+    cipher = get_cipher()
+    return [decrypt_with(cipher, value) for value in values]
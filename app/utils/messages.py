@@ -1,5 +1,6 @@
 class ResponseMessages:
     FILES_UPLOADED = "Files uploaded successfully"
+    FILES_ACCEPTED = "Files accepted for processing"
     HEALTH_OK = "Document ingestion service is available."
 
 
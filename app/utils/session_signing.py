@@ -0,0 +1,62 @@
+import base64
+import hashlib
+import hmac
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from uuid import UUID
+
+from app.config import app_config
+from app.utils.app_error import AppError, AppErrorType
+
+SEPARATOR = "."
+
+
+@dataclass(frozen=True)
+class SessionToken:
+    session_id: UUID
+    expires_at: datetime | None = None
+
+    @property
+    def is_signed(self) -> bool:
+        return self.expires_at is not None
+
+
+def get_signing_key() -> bytes:
+    secret = app_config.session_signing_secret or app_config.jwt_secret
+    if not secret:
+        raise AppError(AppErrorType.JWT_SECRET_MISSING)
+    return secret.encode("utf-8")
+
+
+def build_signature(payload: str) -> str:
+    digest = hmac.new(
+        get_signing_key(), payload.encode("utf-8"), hashlib.sha256
+    ).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+def sign_session_token(session_id: UUID, expires_at: datetime) -> str:
+    payload = f"{session_id}{SEPARATOR}{int(expires_at.timestamp())}"
+    return f"{payload}{SEPARATOR}{build_signature(payload)}"
+
+
+def parse_session_token(token: str) -> SessionToken:
+    parts = token.strip().split(SEPARATOR)
+    try:
+        session_id = UUID(parts[0])
+    except ValueError as error:
+        raise AppError(AppErrorType.SESSION_TOKEN_INVALID) from error
+    if len(parts) == 1:
+        return SessionToken(session_id=session_id)
+    if len(parts) != 3 or not parts[1].isdigit():
+        raise AppError(AppErrorType.SESSION_TOKEN_INVALID)
+
+    payload = f"{parts[0]}{SEPARATOR}{parts[1]}"
+    if not hmac.compare_digest(
+        build_signature(payload).encode("ascii"), parts[2].encode("utf-8")
+    ):
+        raise AppError(AppErrorType.SESSION_TOKEN_INVALID)
+    return SessionToken(
+        session_id=session_id,
+        expires_at=datetime.fromtimestamp(int(parts[1]), tz=UTC),
+    )
@@ -0,0 +1,7 @@
+import json
+from typing import Any
+
+
+def format_sse_event(event: str, data: dict[str, Any]) -> str:
+    payload = json.dumps(data, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n"
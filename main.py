@@ -1,4 +1,5 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
 import structlog
@@ -9,8 +10,18 @@ from fastapi.responses import JSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
+from app.config import app_config
+from app.database import async_engine
 from app.middleware import log_requests
-from app.routes import ask, auth, health, upload
+from app.routes import ask, auth, health, jobs, stats, upload
+from app.services import (
+    shutdown_extraction_executor,
+    start_ingestion_workers,
+    stop_ingestion_workers,
+    stop_warm_up,
+    time_startup_phase,
+    warm_up,
+)
 from app.utils.app_error import AppError
 from app.utils.logging import configure_logging
 from app.utils.rate_limit import limiter
@@ -26,8 +37,26 @@ def run_migrations() -> None:
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    run_migrations()
+    with time_startup_phase("startup"):
+        if app_config.run_migrations_on_startup:
+            with time_startup_phase("migrations"):
+                await asyncio.to_thread(run_migrations)
+        with time_startup_phase("ingestion_workers"):
+            start_ingestion_workers()
+    warm_up_task = (
+        asyncio.create_task(warm_up())
+        if app_config.warm_up_on_startup
+        else None
+    )
     yield
+    if warm_up_task is not None:
+        warm_up_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await warm_up_task
+    await stop_warm_up()
+    await stop_ingestion_workers()
+    await shutdown_extraction_executor()
+    await async_engine.dispose()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -43,6 +72,8 @@ async def handle_app_error(request: Request, exc: AppError) -> JSONResponse:
 
 
 app.include_router(health.router)
+app.include_router(stats.router)
 app.include_router(upload.router)
+app.include_router(jobs.router)
 app.include_router(ask.router)
 app.include_router(auth.router)
@@ -0,0 +1,74 @@
+"""add owner scope to embedded documents
+
+Revision ID: 2a21ff53444b
+Revises: e3b3c9a4f6d1
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2a21ff53444b"
+down_revision: Union[str, Sequence[str], None] = "e3b3c9a4f6d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "EmbeddedDocuments",
+        sa.Column("session_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.add_column(
+        "EmbeddedDocuments",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.execute(
+        'UPDATE "EmbeddedDocuments" AS e '
+        "SET session_id = d.session_id, user_id = d.user_id "
+        'FROM "Documents" AS d '
+        'WHERE e."documentId" = d.id'
+    )
+    op.create_index(
+        "idx_embedded_documents_session_id_document_id",
+        "EmbeddedDocuments",
+        ["session_id", "documentId"],
+    )
+    op.create_index(
+        "idx_embedded_documents_user_id_document_id",
+        "EmbeddedDocuments",
+        ["user_id", "documentId"],
+    )
+    op.create_index(
+        "idx_documents_user_id_id",
+        "Documents",
+        ["user_id", "id"],
+    )
+    op.create_index(
+        "idx_documents_session_id_id",
+        "Documents",
+        ["session_id", "id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_documents_session_id_id", table_name="Documents")
+    op.drop_index("idx_documents_user_id_id", table_name="Documents")
+    op.drop_index(
+        "idx_embedded_documents_user_id_document_id",
+        table_name="EmbeddedDocuments",
+    )
+    op.drop_index(
+        "idx_embedded_documents_session_id_document_id",
+        table_name="EmbeddedDocuments",
+    )
+    op.drop_column("EmbeddedDocuments", "user_id")
+    op.drop_column("EmbeddedDocuments", "session_id")
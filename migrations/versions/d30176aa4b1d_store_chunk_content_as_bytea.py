@@ -0,0 +1,90 @@
+"""store chunk content as versioned binary ciphertext
+
+Revision ID: d30176aa4b1d
+Revises: 2a21ff53444b
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d30176aa4b1d"
+down_revision: Union[str, Sequence[str], None] = "2a21ff53444b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+STAGING_COLUMN = "content_converted"
+FIRST_ID = "00000000-0000-0000-0000-000000000000"
+
+HEX_TO_BINARY = r"""
+CASE
+    WHEN content ~ '^[0-9a-f]+\.[0-9a-f]{24}$' THEN
+        '\x01'::bytea
+        || decode(split_part(content, '.', 2), 'hex')
+        || decode(split_part(content, '.', 1), 'hex')
+    ELSE '\x00'::bytea || convert_to(content, 'UTF8')
+END
+"""
+
+BINARY_TO_HEX = """
+CASE
+    WHEN length(content) = 0 THEN ''
+    WHEN get_byte(content, 0) = 1 THEN
+        encode(substring(content FROM 14), 'hex')
+        || '.'
+        || encode(substring(content FROM 2 FOR 12), 'hex')
+    ELSE convert_from(substring(content FROM 2), 'UTF8')
+END
+"""
+
+
+def convert_content(expression: str, column_type: sa.types.TypeEngine) -> None:
+    op.add_column(
+        "EmbeddedDocuments",
+        sa.Column(STAGING_COLUMN, column_type, nullable=True),
+    )
+    batch_update = sa.text(
+        'WITH batch AS (SELECT id FROM "EmbeddedDocuments" '
+        "WHERE id > CAST(:last_id AS uuid) ORDER BY id LIMIT :batch_size), "
+        f'updated AS (UPDATE "EmbeddedDocuments" SET {STAGING_COLUMN} = '
+        f"{expression} FROM batch "
+        'WHERE "EmbeddedDocuments".id = batch.id) '
+        "SELECT id FROM batch ORDER BY id DESC LIMIT 1"
+    )
+    last_id = FIRST_ID
+    with op.get_context().autocommit_block():
+        while last_id is not None:
+            last_id = (
+                op.get_bind()
+                .execute(
+                    batch_update,
+                    {"last_id": str(last_id), "batch_size": BATCH_SIZE},
+                )
+                .scalar()
+            )
+
+    op.execute(
+        f'UPDATE "EmbeddedDocuments" SET {STAGING_COLUMN} = {expression} '
+        f"WHERE {STAGING_COLUMN} IS NULL"
+    )
+    op.alter_column("EmbeddedDocuments", STAGING_COLUMN, nullable=False)
+    op.drop_column("EmbeddedDocuments", "content")
+    op.alter_column(
+        "EmbeddedDocuments", STAGING_COLUMN, new_column_name="content"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    convert_content(HEX_TO_BINARY, sa.LargeBinary())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    convert_content(BINARY_TO_HEX, sa.Text())
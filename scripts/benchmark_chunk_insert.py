@@ -0,0 +1,107 @@
+import argparse
+import statistics
+import time
+from uuid import uuid4
+
+import numpy as np
+from sqlmodel import Session
+
+from app.config import app_config
+from app.database import engine
+from app.models import Document, EmbeddedDocument
+from app.services.bulk_copy import copy_documents, copy_embedded_documents
+from app.utils import encrypt
+
+CHUNK_TEXT = "lorem ipsum dolor sit amet " * 37
+
+
+def build_rows(
+    documents_count: int, chunks_per_document: int, rng: np.random.Generator
+) -> tuple[list[Document], list[EmbeddedDocument]]:
+    session_id = uuid4()
+    documents = [
+        Document(session_id=session_id, metadata_={"filename": f"{index}.pdf"})
+        for index in range(documents_count)
+    ]
+    content = encrypt(CHUNK_TEXT)
+    embeddings = rng.standard_normal(
+        (
+            documents_count * chunks_per_document,
+            app_config.embedding_dimensions,
+        ),
+        dtype=np.float32,
+    )
+    records = [
+        EmbeddedDocument(
+            content=content,
+            metadata_={
+                "chunk_index": index,
+                "chunk_count": chunks_per_document,
+            },
+            document_id=document.id,
+            session_id=session_id,
+            embedding=embeddings[
+                document_index * chunks_per_document + index
+            ].tolist(),
+        )
+        for document_index, document in enumerate(documents)
+        for index in range(chunks_per_document)
+    ]
+    return documents, records
+
+
+def insert_with_orm(
+    session: Session,
+    documents: list[Document],
+    records: list[EmbeddedDocument],
+) -> None:
+    session.add_all(documents)
+    session.add_all(records)
+    session.flush()
+
+
+def insert_with_copy(
+    session: Session,
+    documents: list[Document],
+    records: list[EmbeddedDocument],
+) -> None:
+    copy_documents(session, documents)
+    copy_embedded_documents(session, records)
+
+
+def measure(insert, args, rng: np.random.Generator) -> list[float]:
+    durations = []
+    for _ in range(args.runs):
+        documents, records = build_rows(
+            args.documents, args.chunks_per_document, rng
+        )
+        with Session(engine) as session:
+            started_at = time.perf_counter()
+            insert(session, documents, records)
+            durations.append((time.perf_counter() - started_at) * 1000)
+            session.rollback()
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare ORM and COPY insertion of chunk rows."
+    )
+    parser.add_argument("--documents", type=int, default=5)
+    parser.add_argument("--chunks-per-document", type=int, default=400)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    rows = args.documents * args.chunks_per_document
+    print(f"{'path':<8}{'rows':>8}{'median ms':>12}{'rows/s':>12}")
+    for name, insert in (("orm", insert_with_orm), ("copy", insert_with_copy)):
+        median_ms = statistics.median(measure(insert, args, rng))
+        print(
+            f"{name:<8}{rows:>8}{median_ms:>12.1f}"
+            f"{rows / (median_ms / 1000):>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import argparse
+import random
+import statistics
+import time
+
+import numpy as np
+from langchain_openai import OpenAIEmbeddings
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from app.database import engine
+from app.models import EmbeddedDocument
+from app.services.document_store import EMBEDDING_MODEL
+from app.utils import decrypt_many
+
+FULL_DIMENSIONS = 1536
+QUERY_LENGTH = 200
+
+
+def load_corpus(sample_size: int) -> list[str]:
+    statement = select(EmbeddedDocument.content).limit(sample_size)
+    with Session(engine) as session:
+        return decrypt_many(session.exec(statement).all())
+
+
+def embed(texts: list[str], dimensions: int) -> np.ndarray:
+    embeddings = OpenAIEmbeddings(
+        model=EMBEDDING_MODEL,
+        dimensions=dimensions if dimensions != FULL_DIMENSIONS else None,
+    )
+    return np.asarray(embeddings.embed_documents(texts), dtype=np.float32)
+
+
+def exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> list[set]:
+    corpus = corpus / np.linalg.norm(corpus, axis=1, keepdims=True)
+    queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    scores = queries @ corpus.T
+    return [set(np.argsort(-row)[:k].tolist()) for row in scores]
+
+
+def to_literal(vector: np.ndarray) -> str:
+    return "[" + ",".join(f"{value:.7g}" for value in vector) + "]"
+
+
+def run_mode(
+    storage_type: str,
+    corpus: np.ndarray,
+    queries: np.ndarray,
+    truth: list[set],
+    k: int,
+    ef_search: int,
+) -> dict:
+    dimensions = corpus.shape[1]
+    column_type = f"{storage_type}({dimensions})"
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TEMP TABLE bench_embeddings "
+                f"(id integer PRIMARY KEY, embedding {column_type}) "
+                "ON COMMIT DROP"
+            )
+        )
+        connection.execute(
+            text(
+                "INSERT INTO bench_embeddings (id, embedding) "
+                f"VALUES (:id, CAST(:embedding AS {column_type}))"
+            ),
+            [
+                {"id": index, "embedding": to_literal(vector)}
+                for index, vector in enumerate(corpus)
+            ],
+        )
+        connection.execute(
+            text(
+                "CREATE INDEX ON bench_embeddings "
+                f"USING hnsw (embedding {storage_type}_cosine_ops)"
+            )
+        )
+        connection.execute(text(f"SET LOCAL hnsw.ef_search = {ef_search}"))
+        size_bytes = connection.execute(
+            text("SELECT pg_total_relation_size('bench_embeddings')")
+        ).scalar()
+
+        latencies, recalls = [], []
+        for query, expected in zip(queries, truth, strict=True):
+            started_at = time.perf_counter()
+            rows = connection.execute(
+                text(
+                    "SELECT id FROM bench_embeddings ORDER BY embedding <=> "
+                    f"CAST(:query AS {column_type}) LIMIT :k"
+                ),
+                {"query": to_literal(query), "k": k},
+            ).all()
+            latencies.append((time.perf_counter() - started_at) * 1000)
+            recalls.append(len(expected & {row[0] for row in rows}) / k)
+
+    latencies.sort()
+    return {
+        "mode": column_type,
+        "recall": statistics.mean(recalls),
+        "p50_ms": latencies[len(latencies) // 2],
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "size_kb": size_bytes // 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare recall and latency of embedding storage modes."
+    )
+    parser.add_argument("--sample-size", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--ef-search", type=int, default=40)
+    parser.add_argument(
+        "--dimensions", type=int, nargs="+", default=[1536, 768, 512]
+    )
+    args = parser.parse_args()
+
+    corpus_texts = load_corpus(args.sample_size)
+    if not corpus_texts:
+        raise RuntimeError("No chunks found to benchmark")
+    query_texts = [
+        chunk[:QUERY_LENGTH]
+        for chunk in random.sample(
+            corpus_texts, min(args.queries, len(corpus_texts))
+        )
+    ]
+
+    full_corpus = embed(corpus_texts, FULL_DIMENSIONS)
+    full_queries = embed(query_texts, FULL_DIMENSIONS)
+    truth = exact_top_k(full_corpus, full_queries, args.k)
+
+    results = []
+    for dimensions in args.dimensions:
+        if dimensions == FULL_DIMENSIONS:
+            corpus, queries = full_corpus, full_queries
+        else:
+            corpus = embed(corpus_texts, dimensions)
+            queries = embed(query_texts, dimensions)
+        for storage_type in ("vector", "halfvec"):
+            results.append(
+                run_mode(
+                    storage_type, corpus, queries, truth, args.k, args.ef_search
+                )
+            )
+
+    print(f"{'mode':<16}{'recall':>8}{'p50 ms':>10}{'p95 ms':>10}{'KB':>10}")
+    for result in results:
+        print(
+            f"{result['mode']:<16}{result['recall']:>8.3f}"
+            f"{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}"
+            f"{result['size_kb']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import logging
+
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+from app.database import engine
+from app.models import EmbeddedDocument
+from app.services.document_store import embed_texts
+from app.utils import decrypt_many
+
+logging.basicConfig(
+    level="INFO",
+    format="%(asctime)s %(levelname)s %(message)s",
+)
+logger = logging.getLogger("reembed_chunks")
+
+
+def reembed_batch(
+    after_id, batch_size: int, include_embedded: bool
+) -> tuple[int, object]:
+    statement = select(EmbeddedDocument.id, EmbeddedDocument.content)
+    if not include_embedded:
+        statement = statement.where(EmbeddedDocument.embedding.is_(None))
+    if after_id is not None:
+        statement = statement.where(EmbeddedDocument.id > after_id)
+    statement = statement.order_by(EmbeddedDocument.id).limit(batch_size)
+
+    with Session(engine) as session:
+        rows = session.exec(statement).all()
+        if not rows:
+            return 0, after_id
+        embeddings = embed_texts(decrypt_many([content for _, content in rows]))
+        session.exec(
+            update(EmbeddedDocument),
+            params=[
+                {"id": chunk_id, "embedding": embedding}
+                for (chunk_id, _), embedding in zip(
+                    rows, embeddings, strict=True
+                )
+            ],
+        )
+        session.commit()
+    return len(rows), rows[-1][0]
+
+
+def reembed_chunks(batch_size: int, include_embedded: bool) -> int:
+    total, after_id = 0, None
+    while True:
+        count, after_id = reembed_batch(after_id, batch_size, include_embedded)
+        if not count:
+            break
+        total += count
+        logger.info("re-embedded batch; chunks=%s total=%s", count, total)
+    logger.info("re-embedding complete; total=%s", total)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Re-embed chunks with the configured embedding settings."
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="re-embed every chunk, not only chunks without an embedding",
+    )
+    args = parser.parse_args()
+    reembed_chunks(args.batch_size, args.all)
+
+
+if __name__ == "__main__":
+    main()
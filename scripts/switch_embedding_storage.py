@@ -0,0 +1,89 @@
+import argparse
+import logging
+
+from sqlalchemy import text
+
+from app.config import app_config
+from app.database import engine
+from scripts.reembed_chunks import reembed_chunks
+
+logging.basicConfig(
+    level="INFO",
+    format="%(asctime)s %(levelname)s %(message)s",
+)
+logger = logging.getLogger("switch_embedding_storage")
+
+OPERATOR_CLASSES = {
+    "vector": "vector_cosine_ops",
+    "halfvec": "halfvec_cosine_ops",
+}
+CURRENT_TYPE_SQL = text(
+    "SELECT t.typname, a.atttypmod FROM pg_attribute a "
+    "JOIN pg_type t ON t.oid = a.atttypid "
+    "WHERE a.attrelid = '\"EmbeddedDocuments\"'::regclass "
+    "AND a.attname = 'embedding'"
+)
+
+
+def get_current_embedding_type() -> tuple[str, int]:
+    with engine.connect() as connection:
+        storage_type, dimensions = connection.execute(CURRENT_TYPE_SQL).one()
+    return storage_type, dimensions
+
+
+def set_embedding_type(storage_type: str, dimensions: int, keep: bool) -> None:
+    column_type = f"{storage_type}({dimensions})"
+    using = f"embedding::{column_type}" if keep else "NULL"
+    with engine.begin() as connection:
+        connection.execute(text("SET LOCAL statement_timeout = 0"))
+        connection.execute(text('DROP INDEX IF EXISTS "idx_embedding_cosine"'))
+        connection.execute(
+            text(
+                'ALTER TABLE "EmbeddedDocuments" '
+                f"ALTER COLUMN embedding TYPE {column_type} USING {using}"
+            )
+        )
+        connection.execute(
+            text(
+                'CREATE INDEX "idx_embedding_cosine" ON "EmbeddedDocuments" '
+                f"USING hnsw (embedding {OPERATOR_CLASSES[storage_type]})"
+            )
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Retype the embedding column to EMBEDDING_STORAGE_TYPE and "
+            "EMBEDDING_DIMENSIONS, rebuild the HNSW index and re-embed."
+        )
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    storage_type = app_config.embedding_storage_type
+    dimensions = app_config.embedding_dimensions
+    current_type, current_dimensions = get_current_embedding_type()
+    if (current_type, current_dimensions) == (storage_type, dimensions):
+        logger.info(
+            "embedding column already %s(%s); nothing to do",
+            storage_type,
+            dimensions,
+        )
+        return
+
+    keep = current_dimensions == dimensions
+    logger.info(
+        "switching embedding column %s(%s) -> %s(%s)",
+        current_type,
+        current_dimensions,
+        storage_type,
+        dimensions,
+    )
+    set_embedding_type(storage_type, dimensions, keep)
+    if not keep:
+        reembed_chunks(args.batch_size, include_embedded=False)
+
+
+if __name__ == "__main__":
+    main()